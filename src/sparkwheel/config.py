@@ -2,21 +2,50 @@
 
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 from .loader import Loader
 from .metadata import MetadataRegistry
 from .operators import _validate_delete_operator, apply_operators, validate_operators
 from .parser import Parser
-from .path_utils import split_id
+from .path_utils import split_id_parts
 from .preprocessor import Preprocessor
 from .resolver import Resolver
-from .utils import PathLike, ensure_tuple, look_up_option, optional_import
-from .utils.constants import ID_SEP_KEY, REMOVE_KEY, REPLACE_KEY
+from .utils import PathLike, copy_config, ensure_tuple, look_up_option, optional_import
+from .utils.constants import EXPR_KEY, ID_SEP_KEY, RAW_REF_KEY, REMOVE_KEY, REPLACE_KEY, RESOLVED_REF_KEY
 from .utils.exceptions import ConfigKeyError
 
 __all__ = ["Config"]
 
+_MISSING = object()  # get() default that cannot collide with a stored value
+
+_SPECIAL_PREFIXES = frozenset({RESOLVED_REF_KEY, RAW_REF_KEY, EXPR_KEY})
+_PLAIN_LEAVES = frozenset({int, float, bool, type(None)})
+
+
+def _is_plain(config: Any) -> bool:
+    """Check whether `config` is plain data that resolves to a copy of itself.
+
+    Plain data is built from dicts, lists and scalars only, with no references,
+    expressions or components anywhere in the tree.
+    """
+    stack = [config]
+    while stack:
+        node = stack.pop()
+        t = type(node)
+        if t is dict:
+            if "_target_" in node:
+                return False
+            stack.extend(node.values())
+        elif t is list:
+            stack.extend(node)
+        elif t is str:
+            if node[:1] in _SPECIAL_PREFIXES:
+                return False
+        elif t not in _PLAIN_LEAVES:
+            return False
+    return True
+
 
 class Config:
     """Configuration management with resolved references, raw references, expressions, and instantiation.
@@ -69,6 +98,8 @@ class Config:
         self._metadata = MetadataRegistry()
         self._resolver = Resolver()
         self._is_parsed = False
+        self._dirty: set[str] = set()  # IDs set since the last parse, re-parsed incrementally
+        self._plain: dict[str, Any] | None = None  # Resolved copies while the config is plain data
 
         # Process globals (import string module paths)
         self._globals: dict[str, Any] = {}
@@ -137,12 +168,7 @@ class Config:
         # Handle file(s) input
         file_list = ensure_tuple(source)
         for filepath in file_list:
-            loaded_data, loaded_metadata = config._loader.load_file(filepath)
-            # Validate operators before applying
-            validate_operators(loaded_data)
-            # Merge data and metadata
-            config._data = apply_operators(config._data, loaded_data)
-            config._metadata.merge(loaded_metadata)
+            config._merge_loaded(*config._loader.load_file(filepath))
 
         # Validate against schema if provided
         if schema is not None:
@@ -150,6 +176,53 @@ class Config:
 
         return config
 
+    @classmethod
+    def loads(
+        cls,
+        text: str | Sequence[str],
+        globals: dict[str, Any] | None = None,
+        schema: type | None = None,
+    ) -> "Config":
+        """Load configuration from YAML string(s).
+
+        Same as load() for files, without touching the filesystem. Multiple
+        strings are merged in order exactly like multiple files.
+
+        Args:
+            text: YAML document or list of documents
+            globals: Pre-imported packages for expressions
+            schema: Optional dataclass schema for validation
+
+        Returns:
+            New Config instance
+
+        Examples:
+            >>> config = Config.loads("model:\\n  lr: 0.001")
+
+            >>> # Multiple documents (merged)
+            >>> config = Config.loads(["a: 1", "b: 2"])
+        """
+        config = cls(globals=globals)
+
+        texts = [text] if isinstance(text, str) else text
+        for doc in texts:
+            config._merge_loaded(*config._loader.load_string(doc))
+
+        if schema is not None:
+            config.validate(schema)
+
+        return config
+
+    def _merge_loaded(self, data: dict, metadata: MetadataRegistry) -> None:
+        """Validate operators in loaded data, then merge it and its metadata in."""
+        validate_operators(data)
+        if not self._data and not any(isinstance(k, str) and k.startswith((REPLACE_KEY, REMOVE_KEY)) for k in data):
+            # Nothing to merge into: the loader's private copy is used as is instead of copied again
+            self._data = data
+        else:
+            self._data = apply_operators(self._data, data)
+        self._metadata.merge(metadata)
+
     @classmethod
     def from_cli(
         cls,
@@ -267,24 +340,26 @@ class Config:
             self._invalidate_resolution()
             return
 
-        keys = split_id(id)
+        keys = split_id_parts(id)
+        changed = None  # Shallowest ID whose subtree is replaced
 
         # Ensure root is dict
         if not isinstance(self._data, dict):
             self._data = {}
+            changed = ""
 
         # Create missing intermediate paths
         current = self._data
-        for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            elif not isinstance(current[k], dict):
+        for i, k in enumerate(keys[:-1]):
+            if k not in current or not isinstance(current[k], dict):
                 current[k] = {}
+                if changed is None:
+                    changed = ID_SEP_KEY.join(keys[: i + 1])
             current = current[k]
 
         # Set final value
         current[keys[-1]] = value
-        self._invalidate_resolution()
+        self._mark_dirty(id if changed is None else changed)
 
     def validate(self, schema: type) -> None:
         """Validate configuration against a dataclass schema.
@@ -381,12 +456,13 @@ class Config:
                     self._delete_nested_key(actual_key)
 
             else:
-                # Default: compose (merge dict or extend list)
-                if key in self and isinstance(self[key], dict) and isinstance(value, dict):
-                    merged = apply_operators(self[key], value)
+                # Default: compose (merge dict or extend list); the current value is looked up once
+                current = self.get(key, _MISSING)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    merged = apply_operators(current, value)
                     self.set(key, merged)
-                elif key in self and isinstance(self[key], list) and isinstance(value, list):
-                    self.set(key, self[key] + value)
+                elif isinstance(current, list) and isinstance(value, list):
+                    self.set(key, current + value)
                 else:
                     # Normal set (handles nested paths with ::)
                     self.set(key, value)
@@ -394,7 +470,7 @@ class Config:
     def _delete_nested_key(self, key: str) -> None:
         """Delete a key, supporting nested paths with ::."""
         if ID_SEP_KEY in key:
-            keys = split_id(key)
+            keys = split_id_parts(key)
             parent_id = ID_SEP_KEY.join(keys[:-1])
             parent = self[parent_id] if parent_id else self._data
             if isinstance(parent, dict) and keys[-1] in parent:
@@ -461,9 +537,19 @@ class Config:
             >>> type(optimizer).__name__
             'Adam'
         """
-        # Parse if needed
+        # Parse if needed (only the subtrees changed by set() once already parsed)
         if not self._is_parsed or not lazy:
             self._parse()
+        elif self._dirty:
+            self._parse(reset=False)
+
+        if self._plain is not None:
+            value = self._resolve_plain(id, self._plain)
+            if value is not _MISSING:
+                return value
+            # Unknown IDs go through the resolver for its suggestions and defaults
+            self._plain = None
+            self._index()
 
         # Resolve and return
         try:
@@ -484,23 +570,90 @@ class Config:
         Internal method called automatically by resolve().
 
         Args:
-            reset: Whether to reset the resolver before parsing (default: True)
+            reset: Whether to reset the resolver before parsing (default: True).
+                With reset=False an already-parsed config only re-parses the
+                subtrees changed by set() since the last parse.
         """
         # Reset resolver if requested
         if reset:
             self._resolver.reset()
+            self._dirty.clear()
+        elif self._is_parsed:
+            if self._dirty:
+                self._reparse_dirty()
+            return
+
+        self._is_parsed = True
+        # Plain data has nothing to preprocess, reference or instantiate
+        if _is_plain(self._data):
+            self._plain = {}
+            return
+        self._plain = None
+        self._index()
 
+    def _index(self) -> None:
+        """Preprocess the config and hand its items to the resolver."""
         # Stage 1: Preprocess (% raw references, @:: relative resolved IDs)
         self._data = self._preprocessor.process(self._data, self._data, id="")
 
-        # Stage 2: Parse config tree to create Items
+        # Stage 2: Index the config tree; Items are created when first resolved
         parser = Parser(globals=self._globals, metadata=self._metadata)
-        items = parser.parse(self._data)
+        items = parser.parse(self._data, lazy=True)
 
         # Stage 3: Add items to resolver
         self._resolver.add_items(items)
 
-        self._is_parsed = True
+    def _resolve_plain(self, id: str, cache: dict[str, Any]) -> Any:
+        """Resolve an ID of a plain config, see `_is_plain`.
+
+        Args:
+            id: ID path (e.g., "model::lr")
+            cache: Copies handed out so far, by ID
+
+        Returns:
+            A copy of the value at `id`, cached like resolved values, or _MISSING if the
+            ID does not name an existing node
+        """
+        id = str(id)
+        resolved = cache.get(id, _MISSING)
+        if resolved is not _MISSING:
+            return resolved
+
+        node = self._data
+        for k in split_id_parts(id) if id else ():
+            if type(node) is dict and k in node:
+                node = node[k]
+            elif type(node) is list and k.isdigit() and str(int(k)) == k and int(k) < len(node):
+                node = node[int(k)]
+            else:
+                return _MISSING
+        resolved = cache[id] = copy_config(node)
+        return resolved
+
+    def _reparse_dirty(self) -> None:
+        """Re-parse only the subtrees changed by set() since the last parse.
+
+        The resolver drops the items of the changed subtrees, their ancestors and
+        everything that referenced them; those are rebuilt from the current data while
+        all other items keep their resolved values. See `Resolver.invalidate` for which
+        dependencies are tracked.
+        """
+        # A change nested inside another changed subtree is covered by the outer one
+        roots = [id for id in self._dirty if not any(id.startswith(other + ID_SEP_KEY) for other in self._dirty)]
+        self._dirty.clear()
+        stale = self._resolver.invalidate(roots)
+
+        parser = Parser(globals=self._globals, metadata=self._metadata)
+        for id in roots:
+            keys = split_id_parts(id)
+            parent = self._get_by_id(ID_SEP_KEY.join(keys[:-1]))
+            parent[keys[-1]] = self._preprocessor.process(parent[keys[-1]], self._data, id=id)
+            self._resolver.add_items(parser.parse(parent[keys[-1]], id_prefix=id, lazy=True))
+
+        # Ancestors and dependents outside the changed subtrees get a fresh single item
+        for id in stale:
+            if self._resolver.get_item(id) is None and not any(id.startswith(root + ID_SEP_KEY) for root in roots):
+                self._resolver.add_item(parser.create_item(self._get_by_id(id), id))
 
     def _get_by_id(self, id: str) -> Any:
         """Get config value by ID path.
@@ -518,7 +671,7 @@ class Config:
             return self._data
 
         config = self._data
-        for k in split_id(id):
+        for k in split_id_parts(id):
             if not isinstance(config, (dict, list)):
                 raise ValueError(f"Config must be dict or list for key `{k}`, but got {type(config)}: {config}")
             try:
@@ -531,8 +684,25 @@ class Config:
     def _invalidate_resolution(self) -> None:
         """Invalidate cached resolution (called when config changes)."""
         self._is_parsed = False
+        self._dirty.clear()
+        self._plain = None
         self._resolver.reset()
 
+    def _mark_dirty(self, id: str) -> None:
+        """Record a changed subtree for incremental re-parsing.
+
+        Before the first parse, when the root itself changes, or when references
+        enter a plain config, the whole parse is invalidated instead.
+        """
+        if id == "" or not self._is_parsed:
+            self._invalidate_resolution()
+        elif self._plain is None:
+            self._dirty.add(id)
+        elif _is_plain(self._get_by_id(id)):
+            self._plain.clear()  # Still plain data: only the cached copies are stale
+        else:
+            self._invalidate_resolution()
+
     def __getitem__(self, id: str) -> Any:
         """Get config value by ID (subscript access).
 
@@ -582,16 +752,22 @@ class Config:
         return f"Config({self._data})"
 
     @staticmethod
-    def export_config_file(config: dict, filepath: PathLike, **kwargs: Any) -> None:
+    def export_config_file(config: dict, filepath: PathLike | IO[str], **kwargs: Any) -> None:
         """Export config to YAML file.
 
         Args:
             config: Config dict to export
-            filepath: Target file path
-            kwargs: Additional arguments for yaml.safe_dump
+            filepath: Target file path, or an open text stream to write to
+            kwargs: Additional arguments for yaml.dump
         """
         import yaml
 
+        from .utils.misc import SafeYamlDumper
+
+        if hasattr(filepath, "write"):
+            yaml.dump(config, filepath, Dumper=SafeYamlDumper, **kwargs)
+            return
+
         filepath_str = str(Path(filepath))
         with open(filepath_str, "w") as f:
-            yaml.safe_dump(config, f, **kwargs)
+            yaml.dump(config, f, Dumper=SafeYamlDumper, **kwargs)
@@ -2,6 +2,8 @@
 
 import os
 import sys
+from collections.abc import Mapping
+from typing import Any
 
 __all__ = [
     "enable_colors",
@@ -13,6 +15,7 @@ __all__ = [
     "GREEN",
     "BLUE",
     "GRAY",
+    "BOLD",
     "RESET",
 ]
 
@@ -29,7 +32,7 @@ RESET = "\033[0m"
 _COLORS_ENABLED: bool | None = None
 
 
-def _supports_color() -> bool:
+def _supports_color(stream: Any = None, env: Mapping[str, str] | None = None) -> bool:
     """Auto-detect if the terminal supports colors.
 
     Follows industry standards for color detection:
@@ -39,25 +42,34 @@ def _supports_color() -> bool:
     4. stdout TTY detection (auto-detect)
     5. Default: disable colors
 
+    Args:
+        stream: Output stream to check for a TTY (default: sys.stdout)
+        env: Environment variables to consult (default: os.environ)
+
     Returns:
         True if colors should be enabled, False otherwise
     """
+    if stream is None:
+        stream = sys.stdout
+    if env is None:
+        env = os.environ
+
     # Check NO_COLOR environment variable (https://no-color.org/)
     # Highest priority - explicit user preference to disable
-    if os.environ.get("NO_COLOR"):
+    if env.get("NO_COLOR"):
         return False
 
     # Check sparkwheel-specific disable flag
-    if os.environ.get("SPARKWHEEL_NO_COLOR"):
+    if env.get("SPARKWHEEL_NO_COLOR"):
         return False
 
     # Check FORCE_COLOR environment variable (https://force-color.org/)
     # Explicit enable for CI environments, piping, etc.
-    if os.environ.get("FORCE_COLOR"):
+    if env.get("FORCE_COLOR"):
         return True
 
-    # Auto-detect: Check if stdout is a TTY
-    if hasattr(sys.stdout, "isatty") and sys.stdout.isatty():
+    # Auto-detect: Check if the stream is a TTY
+    if hasattr(stream, "isatty") and stream.isatty():
         return True
 
     # Default: disable colors
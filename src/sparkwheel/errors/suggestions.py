@@ -1,22 +1,32 @@
 """Smart suggestions for typos and common mistakes using Levenshtein distance."""
 
+import functools
 from collections.abc import Sequence
 
+from ..utils.module import optional_import
+
 __all__ = ["get_suggestions", "levenshtein_distance"]
 
+# rapidfuzz computes edit distances in C; the pure-Python DP below is the fallback
+_rapidfuzz_levenshtein, has_rapidfuzz = optional_import("rapidfuzz.distance", name="Levenshtein")
+
 
-def levenshtein_distance(s1: str, s2: str) -> int:
+def levenshtein_distance(s1: str, s2: str, max_distance: int | None = None) -> int:
     """Calculate the Levenshtein distance between two strings.
 
     The Levenshtein distance is the minimum number of single-character edits
     (insertions, deletions, or substitutions) required to change one word into another.
+    Uses rapidfuzz when it is installed.
 
     Args:
         s1: First string
         s2: Second string
+        max_distance: Optional bound; once the distance is known to exceed it,
+            the computation stops early and returns ``max_distance + 1``
 
     Returns:
-        Integer representing the edit distance between s1 and s2
+        Integer representing the edit distance between s1 and s2 (capped at
+        ``max_distance + 1`` when a bound is given)
 
     Examples:
         >>> levenshtein_distance("kitten", "sitting")
@@ -25,27 +35,54 @@ def levenshtein_distance(s1: str, s2: str) -> int:
         0
         >>> levenshtein_distance("hello", "helo")
         1
+        >>> levenshtein_distance("a", "a" * 100, max_distance=3)
+        4
     """
+    if has_rapidfuzz:
+        return _rapidfuzz_levenshtein.distance(s1, s2, score_cutoff=max_distance)
+
     if len(s1) < len(s2):
-        return levenshtein_distance(s2, s1)
+        s1, s2 = s2, s1
+
+    # The distance is at least the difference in length
+    if max_distance is not None and len(s1) - len(s2) > max_distance:
+        return max_distance + 1
 
     if len(s2) == 0:
         return len(s1)
 
-    # Create distance matrix
-    previous_row = range(len(s2) + 1)
-
-    for i, c1 in enumerate(s1):
-        current_row = [i + 1]
-        for j, c2 in enumerate(s2):
-            # Cost of insertions, deletions, or substitutions
-            insertions = previous_row[j + 1] + 1
-            deletions = current_row[j] + 1
-            substitutions = previous_row[j] + (c1 != c2)
-            current_row.append(min(insertions, deletions, substitutions))
-        previous_row = current_row
-
-    return previous_row[-1]
+    # Bit-parallel DP (Myers/Hyyro): one bit per character of the shorter string encodes the
+    # +1/-1 vertical deltas of a matrix column, so each column update is a few integer ops
+    peq: dict[str, int] = {}  # Positions of each character in s2, as a bitmask
+    bit = 1
+    for c in s2:
+        peq[c] = peq.get(c, 0) | bit
+        bit <<= 1
+    full = bit - 1
+    last = bit >> 1
+
+    vp, vn, distance = full, 0, len(s2)
+    remaining = len(s1)
+    for c in s1:
+        eq = peq.get(c, 0)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        hp = vn | ~(xh | vp)
+        hn = vp & xh
+        if hp & last:
+            distance += 1
+        elif hn & last:
+            distance -= 1
+        remaining -= 1
+        # Each remaining character lowers the distance by at most one
+        if max_distance is not None and distance - remaining > max_distance:
+            return max_distance + 1
+        hp = (hp << 1) | 1
+        hn <<= 1
+        vp = (hn | ~(xv | hp)) & full
+        vn = hp & xv
+
+    return distance
 
 
 def get_suggestions(
@@ -78,6 +115,19 @@ def get_suggestions(
     if not key or not available_keys:
         return []
 
+    # Errors for the same miss repeat often (e.g. in loops or retries); rank each miss once
+    return list(_rank_suggestions(key, tuple(available_keys), max_suggestions, similarity_threshold))
+
+
+@functools.lru_cache(maxsize=256)
+def _rank_suggestions(
+    key: str,
+    available_keys: tuple[str, ...],
+    max_suggestions: int,
+    similarity_threshold: float,
+) -> tuple[tuple[str, float], ...]:
+    """Rank `available_keys` by similarity to `key`, memoized; see `get_suggestions`."""
+    key_lower = key.lower()
     scored_suggestions = []
 
     for candidate in available_keys:
@@ -86,7 +136,13 @@ def get_suggestions(
         if max_len == 0:
             continue
 
-        distance = levenshtein_distance(key.lower(), candidate.lower())
+        # Distances beyond this bound cannot reach the threshold (one edit of slack for float rounding)
+        max_distance = int((1.0 - similarity_threshold) * max_len) + 1
+        candidate_lower = candidate.lower()
+        # The length gap alone rules out most unrelated keys, without computing a distance
+        if abs(len(key_lower) - len(candidate_lower)) > max_distance:
+            continue
+        distance = levenshtein_distance(key_lower, candidate_lower, max_distance)
         similarity = 1.0 - (distance / max_len)
 
         # Only include suggestions above threshold
@@ -95,7 +151,7 @@ def get_suggestions(
 
     # Sort by similarity (best first) and limit to max_suggestions
     scored_suggestions.sort(key=lambda x: x[1], reverse=True)
-    return scored_suggestions[:max_suggestions]
+    return tuple(scored_suggestions[:max_suggestions])
 
 
 def format_suggestions(suggestions: list[tuple[str, float]]) -> str:
@@ -1,8 +1,10 @@
 import ast
+import functools
 import warnings
 from abc import ABC, abstractmethod
 from collections.abc import Mapping
 from pprint import pformat
+from types import CodeType
 from typing import Any
 
 from .utils import CompInitMode, first, instantiate, optional_import, run_debug, run_eval
@@ -11,12 +13,37 @@ from .utils.exceptions import EvaluationError, InstantiationError, ModuleNotFoun
 
 __all__ = ["Item", "Expression", "Component", "Instantiable"]
 
+# Leading keywords of the import statements an Expression may hold
+_IMPORT_KEYWORDS = ("import", "from")
+
+
+@functools.lru_cache(maxsize=256)
+def _import_single(import_string: str) -> tuple[str, Any]:
+    """Run a single-name import statement and return (bound name, imported object).
+
+    Raises LookupError for anything else, including failed imports; exceptions are not
+    cached, so a module that becomes importable later is still found.
+    """
+    node = first(ast.iter_child_nodes(ast.parse(import_string)))
+    if not isinstance(node, (ast.Import, ast.ImportFrom)) or len(node.names) != 1:
+        raise LookupError(import_string)
+    name, asname = node.names[0].name, node.names[0].asname or node.names[0].name
+    if isinstance(node, ast.ImportFrom):
+        obj, imported = optional_import(f"{node.module}", name=name)
+    else:
+        obj, imported = optional_import(name)
+    if not imported:
+        raise LookupError(import_string)
+    return asname, obj
+
 
 class Instantiable(ABC):
     """
     Base class for an instantiable object.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def is_disabled(self, *args: Any, **kwargs: Any) -> bool:
         """
@@ -46,6 +73,9 @@ class Item:
         source_location: optional location in source file where this config item was defined.
     """
 
+    # A config tree holds one Item per node, so instances skip the per-object __dict__
+    __slots__ = ("config", "id", "source_location")
+
     def __init__(self, config: Any, id: str = "", source_location: SourceLocation | None = None) -> None:
         self.config = config
         self.id = id
@@ -115,10 +145,23 @@ class Component(Item, Instantiable):
             - `"debug"`: Returns pdb.runcall(component, **kwargs)
     """
 
-    non_arg_keys = {"_target_", "_disabled_", "_requires_", "_mode_"}
+    __slots__ = ("_disabled",)
+
+    non_arg_keys = frozenset({"_target_", "_disabled_", "_requires_", "_mode_"})
 
     def __init__(self, config: Any, id: str = "", source_location: SourceLocation | None = None) -> None:
         super().__init__(config=config, id=id, source_location=source_location)
+        self._disabled: bool | None = None  # parsed `_disabled_`, computed on first is_disabled()
+
+    def update_config(self, config: Any) -> None:
+        """
+        Replace the content of `self.config` with new `config` and drop cached lookups.
+
+        Args:
+            config: content of a `Component`.
+        """
+        super().update_config(config)
+        self._disabled = None
 
     @staticmethod
     def is_instantiable(config: Any) -> bool:
@@ -163,8 +206,10 @@ class Component(Item, Instantiable):
         """
         Utility function used in `instantiate()` to check whether to skip the instantiation.
         """
-        _is_disabled = self.get_config().get("_disabled_", False)
-        return _is_disabled.lower().strip() == "true" if isinstance(_is_disabled, str) else bool(_is_disabled)
+        if self._disabled is None:
+            _is_disabled = self.get_config().get("_disabled_", False)
+            self._disabled = _is_disabled.lower().strip() == "true" if isinstance(_is_disabled, str) else bool(_is_disabled)
+        return self._disabled
 
     def instantiate(self, **kwargs: Any) -> object:
         """
@@ -271,6 +316,7 @@ class Expression(Item):
         [Python eval documentation](https://docs.python.org/3/library/functions.html#eval)
     """
 
+    # No __slots__ here: `run_eval` is a class default that single instances may override
     prefix = EXPR_KEY
     run_eval = run_eval
 
@@ -283,9 +329,29 @@ class Expression(Item):
     ) -> None:
         super().__init__(config=config, id=id, source_location=source_location)
         self.globals = globals if globals is not None else {}
+        self._code: CodeType | None = None  # compiled body, built on first evaluation
+
+    def update_config(self, config: Any) -> None:
+        """
+        Replace the content of `self.config` with new `config` and drop the compiled body.
+
+        Args:
+            config: content of a `Expression`.
+        """
+        super().update_config(config)
+        self._code = None
 
     def _parse_import_string(self, import_string: str) -> Any | None:
         """parse single import statement such as "from pathlib import Path" """
+        if not import_string.startswith(_IMPORT_KEYWORDS):
+            return None
+        try:
+            asname, obj = _import_single(import_string)
+        except LookupError:  # Not a successful single-name import; handled below without the cache
+            pass
+        else:
+            self.globals[asname] = obj
+            return obj
         node = first(ast.iter_child_nodes(ast.parse(import_string)))
         if not isinstance(node, (ast.Import, ast.ImportFrom)):
             return None
@@ -296,12 +362,11 @@ class Expression(Item):
         name, asname = f"{node.names[0].name}", node.names[0].asname
         asname = name if asname is None else f"{asname}"
         if isinstance(node, ast.ImportFrom):
-            self.globals[asname], _ = optional_import(f"{node.module}", name=f"{name}")
-            return self.globals[asname]
-        if isinstance(node, ast.Import):
-            self.globals[asname], _ = optional_import(f"{name}")
-            return self.globals[asname]
-        return None
+            obj, imported = optional_import(f"{node.module}", name=f"{name}")
+        else:
+            obj, imported = optional_import(f"{name}")
+        self.globals[asname] = obj
+        return obj
 
     def evaluate(self, globals: dict | None = None, locals: dict | None = None) -> str | Any | None:
         """Evaluate the expression and return the result.
@@ -321,9 +386,11 @@ class Expression(Item):
         value = self.get_config()
         if not Expression.is_expression(value):
             return None
-        optional_module = self._parse_import_string(value[len(self.prefix) :])
-        if optional_module is not None:
-            return optional_module
+        # A compiled body means this exact string was already found not to be an import
+        if self._code is None:
+            optional_module = self._parse_import_string(value[len(self.prefix) :])
+            if optional_module is not None:
+                return optional_module
         if not self.run_eval:
             return f"{value[len(self.prefix) :]}"
         globals_ = dict(self.globals)
@@ -334,7 +401,9 @@ class Expression(Item):
                 globals_[k] = v
         if not run_debug:
             try:
-                return eval(value[len(self.prefix) :], globals_, locals)
+                if self._code is None:
+                    self._code = compile(value[len(self.prefix) :], "<string>", "eval")
+                return eval(self._code, globals_, locals)
             except Exception as e:
                 raise EvaluationError(
                     f"Failed to evaluate expression: '{value[len(self.prefix) :]}'",
@@ -370,6 +439,7 @@ class Expression(Item):
         """
         if not cls.is_expression(config):
             return False
-        if "import" not in config:
+        # Only strings whose body starts with import/from can be import statements; skip ast.parse otherwise
+        if not config[len(cls.prefix) :].startswith(_IMPORT_KEYWORDS):
             return False
         return isinstance(first(ast.iter_child_nodes(ast.parse(f"{config[len(cls.prefix) :]}"))), (ast.Import, ast.ImportFrom))
@@ -1,20 +1,68 @@
 """YAML configuration loading with source location tracking."""
 
+import functools
+import hashlib
+import io
+import json
+import os
+import pickle
+import stat
 import warnings
 from collections.abc import Sequence
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import yaml
 
 from .metadata import MetadataRegistry
-from .path_patterns import is_yaml_file
-from .utils import CheckKeyDuplicatesYamlLoader, PathLike
+from .path_patterns import is_json_file, is_yaml_file
+from .utils import CheckKeyDuplicatesYamlLoader, PathLike, copy_config, optional_import
 from .utils.constants import ID_SEP_KEY
 from .utils.exceptions import SourceLocation
 
 __all__ = ["Loader"]
 
+# orjson decodes JSON configs several times faster than the stdlib when installed
+orjson, has_orjson = optional_import("orjson")
+
+# Bump when the pickled (config, registry, diagnostics) layout changes to orphan old disk cache entries
+_DISK_CACHE_FORMAT = "2"
+
+
+def _disk_cache_file(path: str, content: bytes) -> Path | None:
+    """Return the persistent parse cache entry for a file, or None unless SPARKWHEEL_CACHE=1.
+
+    Entries live under ``$XDG_CACHE_HOME/sparkwheel`` (default ``~/.cache/sparkwheel``)
+    and are keyed by a SHA-256 of the path, the content and the settings that affect parsing.
+
+    Entries are pickles, and unpickling runs code, so anyone who can write to that directory
+    can run code in every process that loads configs with the cache enabled. The directory
+    is therefore created with mode 0o700, and the cache is skipped with a warning unless it
+    is a real directory owned by the current user and closed to group and others.
+    """
+    if os.environ.get("SPARKWHEEL_CACHE", "0") != "1":
+        return None
+    root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "sparkwheel"
+    try:
+        root.mkdir(mode=0o700, parents=True, exist_ok=True)
+        st = root.lstat()
+    except OSError:
+        return None
+    # Ownership and permission bits are only meaningful on POSIX
+    private = not hasattr(os, "getuid") or (st.st_uid == os.getuid() and not stat.S_IMODE(st.st_mode) & 0o077)
+    if not (stat.S_ISDIR(st.st_mode) and private):
+        warnings.warn(
+            f"Ignoring SPARKWHEEL_CACHE: {root} must be a directory owned by the current user with mode 0o700.",
+            UserWarning,
+            stacklevel=4,
+        )
+        return None
+    key = hashlib.sha256()
+    for part in (_DISK_CACHE_FORMAT, os.environ.get("SPARKWHEEL_STRICT_KEYS", "0"), path):
+        key.update(part.encode() + b"\0")
+    key.update(content)
+    return root / f"{key.hexdigest()}.pkl"
+
 
 class MetadataTrackingYamlLoader(CheckKeyDuplicatesYamlLoader):
     """YAML loader that tracks source locations into MetadataRegistry.
@@ -59,6 +107,8 @@ class MetadataTrackingYamlLoader(CheckKeyDuplicatesYamlLoader):
                 # Pop key from path stack
                 self.id_path_stack.pop()
 
+                if key in mapping:
+                    self.report_duplicate_key(key)
                 mapping[key] = value
 
             return mapping
@@ -122,25 +172,32 @@ class Loader:
     """
 
     def load_file(self, filepath: PathLike) -> tuple[dict, MetadataRegistry]:
-        """Load a single YAML file with metadata tracking.
+        """Load a single YAML (or JSON) file with metadata tracking.
+
+        JSON files skip the YAML parser entirely, so configs converted to JSON
+        load faster; only the root location is tracked for them.
+
+        Parses are cached on the file's inode, size, and modification and change
+        times. A file rewritten in place with the same size within the filesystem's
+        timestamp resolution looks unchanged; call `clear_cache` after such writes.
 
         Args:
-            filepath: Path to YAML file
+            filepath: Path to YAML or JSON file
 
         Returns:
             Tuple of (config_dict, metadata_registry)
 
         Raises:
-            ValueError: If file is not a YAML file
+            ValueError: If file is not a YAML or JSON file
         """
         if not filepath:
             return {}, MetadataRegistry()
 
         filepath_str = str(Path(filepath))
 
-        # Validate YAML extension
-        if not is_yaml_file(filepath_str):
-            raise ValueError(f'Unknown file input: "{filepath}", must be a YAML file (.yaml or .yml)')
+        # Validate extension
+        if not (is_yaml_file(filepath_str) or is_json_file(filepath_str)):
+            raise ValueError(f'Unknown file input: "{filepath}", must be a YAML file (.yaml or .yml) or JSON file (.json)')
 
         # Resolve path (detect potential path traversal)
         resolved_path = Path(filepath_str).resolve()
@@ -153,21 +210,129 @@ class Loader:
                 stacklevel=2,
             )
 
-        # Load YAML with metadata tracking
+        # Parsed files are cached by path and stat signature; callers get private copies
+        st = resolved_path.stat()
+        strict_keys = os.environ.get("SPARKWHEEL_STRICT_KEYS", "0") == "1"
+        config, registry, diagnostics = self._load_file_cached(
+            str(resolved_path), st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size, strict_keys
+        )
+        # Warnings from parsing (e.g. duplicate keys) are replayed on every load, cached or not
+        for message, category in diagnostics:
+            warnings.warn(message, category, stacklevel=2)
+        return copy_config(config), registry.copy()
+
+    @classmethod
+    @functools.lru_cache(maxsize=128)
+    def _load_file_cached(
+        cls, path: str, inode: int, mtime_ns: int, ctime_ns: int, size: int, strict_keys: bool
+    ) -> tuple[dict, MetadataRegistry, tuple[tuple[str, type[Warning]], ...]]:
+        """Parse a YAML or JSON file with metadata tracking, memoized on its stat signature.
+
+        With ``SPARKWHEEL_CACHE=1`` the result is also persisted on disk, so other processes
+        loading the same file skip parsing it.
+
+        Args:
+            path: Resolved path to the file
+            inode: File inode number, part of the cache key (changes when a file is replaced)
+            mtime_ns: File modification time, part of the cache key
+            ctime_ns: File status change time, part of the cache key (also bumped by utime)
+            size: File size in bytes, part of the cache key
+            strict_keys: Whether SPARKWHEEL_STRICT_KEYS=1 is set, part of the cache key since
+                it decides whether duplicate keys warn or raise
+
+        Returns:
+            Tuple of (config_dict, metadata_registry, diagnostics), where diagnostics holds the
+            (message, category) of each warning raised while parsing; the config and registry
+            are shared, so never hand them out directly
+        """
+        with open(path, "rb") as f:
+            content = f.read()
+
+        cache_file = _disk_cache_file(path, content)
+        if cache_file is not None:
+            try:
+                with open(cache_file, "rb") as f:
+                    return pickle.load(f)
+            except (OSError, pickle.UnpicklingError, EOFError):  # Missing, unreadable or truncated entry: reparse
+                pass
+
+        # Record parse warnings instead of emitting them, so cache hits can replay them
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            if is_json_file(path):
+                config, registry = cls._load_json(content, path)
+            else:
+                stream = io.BytesIO(content)
+                stream.name = path  # Named in YAML error messages
+                config, registry = cls().load_stream(stream, source=path)
+        result = config, registry, tuple((str(w.message), w.category) for w in caught)
+
+        if cache_file is not None:
+            # Best effort: write to a private temp file and move it into place atomically
+            try:
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_file, "wb") as f:
+                    pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, cache_file)
+            except OSError:
+                pass
+        return result
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all parsed files, e.g. after rewriting a file within the clock's resolution."""
+        cls._load_file_cached.cache_clear()
+
+    @staticmethod
+    def _load_json(content: bytes, path: str) -> tuple[dict, MetadataRegistry]:
+        """Load a JSON document, registering the document root as its only source location.
+
+        Args:
+            content: Raw JSON document
+            path: Resolved path to the JSON file
+
+        Returns:
+            Tuple of (config_dict, metadata_registry)
+        """
+        config = orjson.loads(content) if has_orjson else json.loads(content)
         registry = MetadataRegistry()
-        with open(resolved_path) as f:
-            config = self._load_yaml_with_metadata(f, str(resolved_path), registry)
+        registry.register("", SourceLocation(filepath=path, line=1, column=1, id=""))
+        return (config if config is not None else {}), registry
 
-        # Strip metadata keys from config (they're now in registry)
-        config = self._strip_metadata(config)
+    def load_string(self, text: str, source: str = "<string>") -> tuple[dict, MetadataRegistry]:
+        """Load YAML from an in-memory string with metadata tracking.
 
-        return config, registry
+        Args:
+            text: YAML document
+            source: Name recorded as the filepath in source locations
+
+        Returns:
+            Tuple of (config_dict, metadata_registry)
+        """
+        return self.load_stream(text, source=source)
+
+    def load_stream(self, stream: IO[str] | IO[bytes] | str, source: str | None = None) -> tuple[dict, MetadataRegistry]:
+        """Load YAML from an open text or binary stream with metadata tracking.
+
+        Args:
+            stream: Readable stream (or string) holding a YAML document
+            source: Name recorded as the filepath in source locations
+                (defaults to the stream's ``name``, or "<stream>")
+
+        Returns:
+            Tuple of (config_dict, metadata_registry)
+        """
+        if source is None:
+            source = str(getattr(stream, "name", "<stream>"))
+        registry = MetadataRegistry()
+        config = self._load_yaml_with_metadata(stream, source, registry)
+        return self._strip_metadata(config), registry
 
     def _load_yaml_with_metadata(self, stream, filepath: str, registry: MetadataRegistry) -> dict:
         """Load YAML and populate metadata registry during construction.
 
         Args:
-            stream: File stream to load from
+            stream: File stream or string to load from
             filepath: Path string for error messages
             registry: MetadataRegistry to populate
 
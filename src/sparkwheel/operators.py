@@ -1,8 +1,8 @@
 """Configuration merging with composition-by-default and operators (=, ~)."""
 
-from copy import deepcopy
 from typing import Any
 
+from .utils import copy_config
 from .utils.constants import REMOVE_KEY, REPLACE_KEY
 from .utils.exceptions import ConfigMergeError
 
@@ -150,114 +150,142 @@ def apply_operators(base: dict, override: dict) -> dict:
         {"a": 1, "b": 5}
     """
     if not isinstance(base, dict) or not isinstance(override, dict):
-        return deepcopy(override)
+        return copy_config(override)
+
+    # Copy once, then merge in place; an explicit stack of (target, pending changes) pairs
+    # replaces recursion, so nested dicts are neither re-copied nor rebuilt per level.
+    # A nested merge is finished before the next key of its parent, keeping key order.
+    result = copy_config(base)
+    stack = [(result, iter(override.items()))]
+
+    while stack:
+        target, pending = stack[-1]
+        for key, value in pending:
+            nested = _merge_key(target, key, value)
+            if nested is not None:
+                stack.append((nested, iter(value.items())))
+                break
+        else:
+            stack.pop()
 
-    result = deepcopy(base)
+    return result
 
-    for key, value in override.items():
-        if not isinstance(key, str):
-            result[key] = deepcopy(value)
-            continue
 
-        # Process replace operator (=key)
-        if key.startswith(REPLACE_KEY):
-            actual_key = key[1:]
-            result[actual_key] = deepcopy(value)
-            continue
+def _merge_key(target: dict, key: Any, value: Any) -> dict | None:
+    """Apply one override entry to `target` in place.
 
-        # Process remove operator (~key)
-        if key.startswith(REMOVE_KEY):
-            actual_key = key[1:]
-            _validate_delete_operator(actual_key, value)
+    Args:
+        target: Dict being merged into (already a private copy)
+        key: Override key, with an optional =/~ operator prefix
+        value: Override value
 
-            # Idempotent: no error if key doesn't exist
-            if actual_key not in result:
-                continue  # Silently skip
-
-            # Handle remove entire key (null or empty value)
-            if value is None or value == "":
-                del result[actual_key]
-                continue
-
-            # Handle remove specific items from list or dict (list value)
-            if isinstance(value, list):
-                base_val = result[actual_key]
-
-                # Remove from list by indices
-                if isinstance(base_val, list):
-                    list_len = len(base_val)
-
-                    # Validate all items are integers and normalize negative indices
-                    normalized_indices = []
-                    for idx in value:
-                        if not isinstance(idx, int):
-                            raise ConfigMergeError(
-                                f"Cannot remove from list '{actual_key}': index must be integer, got {type(idx).__name__}",
-                                suggestion=f"When removing from a list, provide integer indices.\n\n"
-                                f"Example:\n"
-                                f"  ~{actual_key}: [0, 2, 4]  # Remove items at indices 0, 2, 4\n"
-                                f"  ~{actual_key}: [-1]       # Remove last item",
-                            )
-
-                        # Validate index is in bounds
-                        if idx >= list_len or idx < -list_len:
-                            raise ConfigMergeError(
-                                f"Cannot remove from list '{actual_key}': index {idx} out of range (list has {list_len} items)",
-                                suggestion=f"Valid indices are 0 to {list_len - 1}, or -{list_len} to -1.\n"
-                                f"Use null to remove the entire list:\n"
-                                f"  ~{actual_key}: null",
-                            )
-
-                        # Normalize negative indices to positive
-                        normalized_idx = idx if idx >= 0 else list_len + idx
-                        normalized_indices.append(normalized_idx)
-
-                    # Sort indices in descending order and remove duplicates
-                    sorted_indices = sorted(set(normalized_indices), reverse=True)
-
-                    # Remove in descending order to avoid shifting issues
-                    for idx in sorted_indices:
-                        del base_val[idx]
-
-                # Remove from dict by keys
-                elif isinstance(base_val, dict):
-                    for del_key in value:
-                        if del_key not in base_val:
-                            raise ConfigMergeError(
-                                f"Cannot remove non-existent key '{del_key}' from '{actual_key}'",
-                                suggestion=f"The key '{del_key}' does not exist in '{actual_key}'.\n"
-                                f"Available keys: {list(base_val.keys())}",
-                            )
-                        del base_val[del_key]
-
-                else:
-                    raise ConfigMergeError(
-                        f"Cannot remove items from '{actual_key}': expected list or dict, got {type(base_val).__name__}",
-                        suggestion=f"Item removal with '~{actual_key}: [...]' only works for lists and dicts.\n"
-                        f"To remove the entire key:\n"
-                        f"  ~{actual_key}: null",
-                    )
-
-                continue
-
-        # No operator - COMPOSITION-BY-DEFAULT behavior
-        if key in result:
-            base_val = result[key]
-
-            # For dicts: MERGE (composition)
-            if isinstance(base_val, dict) and isinstance(value, dict):
-                result[key] = apply_operators(base_val, value)
-                continue
-
-            # For lists: EXTEND (composition)
-            if isinstance(base_val, list) and isinstance(value, list):
-                result[key] = base_val + value
-                continue
-
-            # For scalars: REPLACE
-            # For type mismatches: REPLACE
-
-        # Set/replace (for new keys or non-matching types)
-        result[key] = deepcopy(value)
+    Returns:
+        The nested dict of `target` to merge `value` into, or None if the entry is done
 
-    return result
+    Raises:
+        ConfigMergeError: If operators are used incorrectly
+    """
+    if not isinstance(key, str):
+        target[key] = copy_config(value)
+        return None
+
+    # Process replace operator (=key)
+    if key.startswith(REPLACE_KEY):
+        actual_key = key[1:]
+        target[actual_key] = copy_config(value)
+        return None
+
+    # Process remove operator (~key)
+    if key.startswith(REMOVE_KEY):
+        actual_key = key[1:]
+        _validate_delete_operator(actual_key, value)
+
+        # Idempotent: no error if key doesn't exist
+        if actual_key not in target:
+            return None  # Silently skip
+
+        # Handle remove entire key (null or empty value)
+        if value is None or value == "":
+            del target[actual_key]
+            return None
+
+        # Handle remove specific items from list or dict (list value)
+        if isinstance(value, list):
+            base_val = target[actual_key]
+
+            # Remove from list by indices
+            if isinstance(base_val, list):
+                list_len = len(base_val)
+
+                # Validate all items are integers and normalize negative indices
+                normalized_indices = []
+                for idx in value:
+                    if not isinstance(idx, int):
+                        raise ConfigMergeError(
+                            f"Cannot remove from list '{actual_key}': index must be integer, got {type(idx).__name__}",
+                            suggestion=f"When removing from a list, provide integer indices.\n\n"
+                            f"Example:\n"
+                            f"  ~{actual_key}: [0, 2, 4]  # Remove items at indices 0, 2, 4\n"
+                            f"  ~{actual_key}: [-1]       # Remove last item",
+                        )
+
+                    # Validate index is in bounds
+                    if idx >= list_len or idx < -list_len:
+                        raise ConfigMergeError(
+                            f"Cannot remove from list '{actual_key}': index {idx} out of range (list has {list_len} items)",
+                            suggestion=f"Valid indices are 0 to {list_len - 1}, or -{list_len} to -1.\n"
+                            f"Use null to remove the entire list:\n"
+                            f"  ~{actual_key}: null",
+                        )
+
+                    # Normalize negative indices to positive
+                    normalized_idx = idx if idx >= 0 else list_len + idx
+                    normalized_indices.append(normalized_idx)
+
+                # Sort indices in descending order and remove duplicates
+                sorted_indices = sorted(set(normalized_indices), reverse=True)
+
+                # Remove in descending order to avoid shifting issues
+                for idx in sorted_indices:
+                    del base_val[idx]
+
+            # Remove from dict by keys
+            elif isinstance(base_val, dict):
+                for del_key in value:
+                    if del_key not in base_val:
+                        raise ConfigMergeError(
+                            f"Cannot remove non-existent key '{del_key}' from '{actual_key}'",
+                            suggestion=f"The key '{del_key}' does not exist in '{actual_key}'.\n"
+                            f"Available keys: {list(base_val.keys())}",
+                        )
+                    del base_val[del_key]
+
+            else:
+                raise ConfigMergeError(
+                    f"Cannot remove items from '{actual_key}': expected list or dict, got {type(base_val).__name__}",
+                    suggestion=f"Item removal with '~{actual_key}: [...]' only works for lists and dicts.\n"
+                    f"To remove the entire key:\n"
+                    f"  ~{actual_key}: null",
+                )
+
+            return None
+
+    # No operator - COMPOSITION-BY-DEFAULT behavior
+    if key in target:
+        base_val = target[key]
+
+        # For dicts: MERGE (composition)
+        if isinstance(base_val, dict) and isinstance(value, dict):
+            return base_val
+
+        # For lists: EXTEND (composition)
+        if isinstance(base_val, list) and isinstance(value, list):
+            base_val.extend(value)
+            return None
+
+        # For scalars: REPLACE
+        # For type mismatches: REPLACE
+
+    # Set/replace (for new keys or non-matching types)
+    target[key] = copy_config(value)
+    return None
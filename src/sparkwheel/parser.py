@@ -1,18 +1,61 @@
 """Parse configuration tree and create Items."""
 
+import sys
 from typing import Any
 
 from .items import Component, Expression, Item
 from .metadata import MetadataRegistry
 from .utils.constants import ID_SEP_KEY
+from .utils.exceptions import SourceLocation
 
-__all__ = ["Parser"]
+__all__ = ["LazyItem", "Parser"]
+
+# Node types that can never become a Component or an Expression
+_PLAIN_TYPES = frozenset({list, int, float, bool, type(None)})
+
+
+class LazyItem:
+    """Placeholder for a config node whose Item has not been created yet.
+
+    Lazily parsed trees store these in the Resolver, which calls realize() the
+    first time it touches the ID; nodes that are never resolved never get an Item.
+
+    Args:
+        config: Config node
+        id: ID path of the node
+        parser: Parser that creates the Item
+        is_import: Whether the node is an import expression, which the Resolver
+            runs before anything else
+    """
+
+    __slots__ = ("config", "id", "is_import", "_parser")
+
+    def __init__(self, config: Any, id: str, parser: "Parser", is_import: bool = False):
+        self.config = config
+        self.id = id
+        self.is_import = is_import
+        self._parser = parser
+
+    def get_id(self) -> str:
+        return self.id
+
+    def get_config(self) -> Any:
+        return self.config
+
+    @property
+    def source_location(self) -> SourceLocation | None:
+        """Location of the node in its source file, as the realized Item would report it."""
+        return self._parser._metadata.get(self.id) if self.id else None
+
+    def realize(self) -> Item:
+        """Create the real Component, Expression, or Item for this node."""
+        return self._parser.create_item(self.config, self.id)
 
 
 class Parser:
     """Parse config tree and create Items with source locations.
 
-    Recursively traverses configuration dictionaries and lists, creating
+    Traverses configuration dictionaries and lists, creating
     appropriate Item subclasses (Component, Expression, or
     plain Item) for each node.
 
@@ -56,45 +99,77 @@ class Parser:
         self._globals = globals
         self._metadata = metadata
 
-    def parse(self, config: Any, id_prefix: str = "") -> list[Item]:
-        """Recursively parse config and create Items.
+    def parse(self, config: Any, id_prefix: str = "", lazy: bool = False) -> list[Item | LazyItem]:
+        """Parse config and create Items.
+
+        The tree is walked with an explicit stack instead of recursion, so deeply
+        nested configs cost no Python frames and cannot hit the recursion limit.
+        Items are emitted in post-order (children before their parent).
 
         Args:
             config: Configuration data to parse (dict, list, or primitive)
             id_prefix: ID path prefix for nested items (e.g., "model::optimizer")
+            lazy: Emit cheap placeholders that the Resolver turns into Items on
+                first use, instead of creating every Item up front
 
         Returns:
-            List of all Items created from the config tree
+            List of all Items (or placeholders) created from the config tree
         """
-        items: list[Item] = []
-        self._parse_recursive(config, id_prefix, items)
+        items: list[Item | LazyItem] = []
+        # (node, id, children_pushed) triples; a container is revisited once its children are done
+        stack: list[tuple[Any, str, bool]] = [(config, id_prefix, False)]
+
+        while stack:
+            node, id, children_pushed = stack.pop()
+
+            # `type() is` is a pointer compare; fall back to isinstance for subclasses
+            t = type(node)
+            is_dict = t is dict or (t is not list and isinstance(node, dict))
+            if not children_pushed and (is_dict or t is list or isinstance(node, list)):
+                stack.append((node, id, True))
+                pairs = node.items() if is_dict else enumerate(node)
+                # Interned so resolver lookups by the same ID hit dict's identity fast path
+                children = [(value, sys.intern(f"{id}{ID_SEP_KEY}{key}" if id else str(key)), False) for key, value in pairs]
+                stack.extend(reversed(children))
+                continue
+
+            if lazy:
+                # Import expressions are found here, once, so resolution need not rescan every item
+                items.append(LazyItem(node, id, self, Expression.is_import_statement(node)))
+            else:
+                items.append(self.create_item(node, id))
+
         return items
 
-    def _parse_recursive(self, config: Any, id: str, items: list[Item]) -> None:
-        """Internal recursive parsing implementation.
+    def create_item(self, config: Any, id: str) -> Item:
+        """Create the appropriate Item subclass for a single config node.
+
+        Unlike parse(), the node's children are not visited.
 
         Args:
-            config: Current config node to parse
-            id: Current ID path
-            items: List to accumulate Items (modified in place)
+            config: Config node
+            id: ID path of the node
+
+        Returns:
+            Component, Expression, or plain Item
         """
         # Get source location for this config node
         source_location = self._metadata.get(id) if id else None
 
-        # Recursively parse nested structures
-        if isinstance(config, dict):
-            for key, value in config.items():
-                sub_id = f"{id}{ID_SEP_KEY}{key}" if id else str(key)
-                self._parse_recursive(value, sub_id, items)
-        elif isinstance(config, list):
-            for idx, value in enumerate(config):
-                sub_id = f"{id}{ID_SEP_KEY}{idx}" if id else str(idx)
-                self._parse_recursive(value, sub_id, items)
-
-        # Create appropriate Item for this node
+        # Plain dict/str/scalar nodes are classified by exact type; anything else takes the generic checks
+        t = type(config)
+        if t is dict:
+            cls = Component if "_target_" in config else Item
+            return cls(config=config, id=id, source_location=source_location)
+        if t is str:
+            if config.startswith(Expression.prefix):
+                return Expression(config=config, id=id, globals=self._globals, source_location=source_location)
+            return Item(config=config, id=id, source_location=source_location)
+        if t in _PLAIN_TYPES:
+            return Item(config=config, id=id, source_location=source_location)
+
         if Component.is_instantiable(config):
-            items.append(Component(config=config, id=id, source_location=source_location))
-        elif Expression.is_expression(config):
-            items.append(Expression(config=config, id=id, globals=self._globals, source_location=source_location))
-        else:
-            items.append(Item(config=config, id=id, source_location=source_location))
+            return Component(config=config, id=id, source_location=source_location)
+        if Expression.is_expression(config):
+            return Expression(config=config, id=id, globals=self._globals, source_location=source_location)
+        return Item(config=config, id=id, source_location=source_location)
@@ -19,6 +19,7 @@ from .utils.constants import RAW_REF_KEY, RESOLVED_REF_KEY
 
 __all__ = [
     "PathPatterns",
+    "is_json_file",
     "is_yaml_file",
 ]
 
@@ -42,8 +43,25 @@ def is_yaml_file(filepath: str) -> bool:
         >>> is_yaml_file("data.json")
         False
     """
-    lower = filepath.lower()
-    return lower.endswith(".yaml") or lower.endswith(".yml")
+    return filepath.lower().endswith((".yaml", ".yml"))
+
+
+def is_json_file(filepath: str) -> bool:
+    """Check if filepath is a JSON file (.json).
+
+    Args:
+        filepath: Path to check
+
+    Returns:
+        True if filepath ends with .json (case-insensitive)
+
+    Examples:
+        >>> is_json_file("config.json")
+        True
+        >>> is_json_file("config.yaml")
+        False
+    """
+    return filepath.lower().endswith(".json")
 
 
 class PathPatterns:
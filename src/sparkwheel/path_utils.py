@@ -4,6 +4,9 @@ Provides helper functions for working with config paths, building on
 the regex patterns from path_patterns.py.
 """
 
+import functools
+import re
+import sys
 from typing import Any
 
 from .path_patterns import PathPatterns
@@ -11,6 +14,7 @@ from .utils.constants import ID_SEP_KEY
 
 __all__ = [
     "split_id",
+    "split_id_parts",
     "normalize_id",
     "resolve_relative_ids",
     "scan_references",
@@ -35,7 +39,32 @@ def split_id(id: str | int) -> list[str]:
         >>> split_id("simple")
         ["simple"]
     """
-    return normalize_id(id).split(ID_SEP_KEY)
+    return list(split_id_parts(id))
+
+
+def split_id_parts(id: str | int) -> tuple[str, ...]:
+    """Split config ID into an immutable tuple of parts, cached per ID.
+
+    Read-only counterpart of `split_id` for hot paths: repeated access to the
+    same path returns the same tuple instead of re-splitting it.
+
+    Args:
+        id: Config ID to split
+
+    Returns:
+        Tuple of ID components
+
+    Examples:
+        >>> split_id_parts("model::optimizer::lr")
+        ("model", "optimizer", "lr")
+    """
+    return _split_id(normalize_id(id))
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_id(id: str) -> tuple[str, ...]:
+    """Split a normalized ID (memoized; tuples are immutable so they can be shared)."""
+    return tuple(id.split(ID_SEP_KEY))
 
 
 def normalize_id(id: str | int) -> str:
@@ -80,16 +109,14 @@ def resolve_relative_ids(current_id: str, value: str) -> str:
     Raises:
         ValueError: If relative reference goes beyond root
     """
-    # Find all relative reference patterns using centralized regex
-    patterns = PathPatterns.find_relative_references(value)
-
-    # Sort by length (longest first) to avoid partial replacements
-    # e.g., replace "@::::" before "@::" so we don't double-process
-    patterns = sorted(set(patterns), key=len, reverse=True)
-
-    current_parts = current_id.split(ID_SEP_KEY) if current_id else []
-
-    for pattern in patterns:
+    # No separator means no relative reference; skip the regex entirely
+    if ID_SEP_KEY not in value:
+        return value
+
+    def to_absolute(match: re.Match) -> str:
+        pattern = match.group(0)
+        # Only strings that really hold a relative reference split the current ID (memoized per ID)
+        current_parts = _split_id(current_id) if current_id else ()
         # Determine symbol (@ for resolved reference, % for raw reference)
         symbol = pattern[0]
 
@@ -105,21 +132,15 @@ def resolve_relative_ids(current_id: str, value: str) -> str:
                 f"has {len(current_parts)} levels"
             )
 
-        # Calculate the absolute path
+        # Going to root level
         if levels_up == len(current_parts):
-            # Going to root level
-            absolute = symbol
-        else:
-            # Going to ancestor at specific level
-            ancestor_parts = current_parts[:-levels_up] if levels_up > 0 else current_parts
-            absolute = symbol + ID_SEP_KEY.join(ancestor_parts)
-            if ancestor_parts:  # Add trailing separator if not at root
-                absolute += ID_SEP_KEY
+            return symbol
 
-        # Replace pattern in value
-        value = value.replace(pattern, absolute)
+        # Going to ancestor at specific level (with a trailing separator, as it is not the root)
+        return symbol + ID_SEP_KEY.join(current_parts[:-levels_up]) + ID_SEP_KEY
 
-    return value
+    # One pass over the string; each match is already the longest run of :: pairs
+    return PathPatterns.RELATIVE_REFERENCE.sub(to_absolute, value)
 
 
 def scan_references(text: str) -> dict[str, int]:
@@ -150,14 +171,18 @@ def scan_references(text: str) -> dict[str, int]:
     if not (is_expr or is_pure_ref):
         return refs
 
-    # Use centralized pattern to find all references
-    ref_ids = PathPatterns.find_absolute_references(text)
+    # Counting is memoized per string; copy so callers may mutate the result
+    return dict(_count_references(text))
 
-    # Count occurrences
-    for ref_id in ref_ids:
-        refs[ref_id] = refs.get(ref_id, 0) + 1
 
-    return refs
+@functools.lru_cache(maxsize=4096)
+def _count_references(text: str) -> tuple[tuple[str, int], ...]:
+    """Count @ references in `text` (memoized; the same strings recur on every re-parse)."""
+    refs: dict[str, int] = {}
+    for ref_id in PathPatterns.find_absolute_references(text):
+        ref_id = sys.intern(ref_id)  # same object as the parser's item ID
+        refs[ref_id] = refs.get(ref_id, 0) + 1
+    return tuple(refs.items())
 
 
 def replace_references(text: str, resolved_refs: dict[str, Any], local_var_name: str = "__local_refs") -> str | Any:
@@ -199,8 +224,8 @@ def replace_references(text: str, resolved_refs: dict[str, Any], local_var_name:
             raise KeyError(f"Reference '@{ref_id}' not found in resolved references")
         return resolved_refs[ref_id]
 
-    if not is_expr:
-        # Not an expression or reference - return as-is
+    if not is_expr or "@" not in text:
+        # Not an expression, or an expression without references - return as-is
         return text
 
     # Expression - find all references and replace with variable access
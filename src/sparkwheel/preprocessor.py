@@ -5,11 +5,11 @@ Handles transformations on raw config dicts before Items are created:
 - Relative ID resolution (@::, @:::: → absolute paths)
 """
 
-from copy import deepcopy
 from typing import Any
 
 from .path_patterns import split_file_and_id
-from .path_utils import resolve_relative_ids, split_id
+from .path_utils import resolve_relative_ids, split_id_parts
+from .utils import copy_config
 from .utils.constants import ID_SEP_KEY, RAW_REF_KEY
 
 __all__ = ["Preprocessor"]
@@ -155,8 +155,11 @@ class Preprocessor:
             # Recursively preprocess the loaded value
             result = self._process_recursive(result, loaded_config, ids, raw_ref_stack)
 
-            # Deep copy for independence
-            return deepcopy(result)
+            # Deep copy containers for independence; scalars are immutable and shared as-is.
+            # A file loaded just for this reference is owned by nobody else, so its value is used directly.
+            if path or not isinstance(result, (dict, list)):
+                return result
+            return copy_config(result)
 
         finally:
             raw_ref_stack.discard(raw_ref)
@@ -180,7 +183,7 @@ class Preprocessor:
             return config
 
         current = config
-        for key in split_id(id):
+        for key in split_id_parts(id):
             if isinstance(current, dict):
                 current = current[key]
             elif isinstance(current, list):
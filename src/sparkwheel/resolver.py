@@ -1,13 +1,14 @@
 """Resolve references between Items."""
 
 import warnings
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import Any
 
 from .items import Component, Expression, Item
+from .parser import LazyItem
 from .path_utils import normalize_id, replace_references, scan_references
 from .utils import allow_missing_reference, look_up_option
-from .utils.constants import ID_SEP_KEY, RESOLVED_REF_KEY
+from .utils.constants import EXPR_KEY, ID_SEP_KEY, RESOLVED_REF_KEY
 from .utils.exceptions import CircularReferenceError, ConfigKeyError
 
 __all__ = ["Resolver"]
@@ -43,6 +44,7 @@ class Resolver:
     _vars = "__local_refs"  # Variable name for resolved refs in expression evaluation
     sep = ID_SEP_KEY  # Separator for nested key access
     ref = RESOLVED_REF_KEY  # Resolved reference prefix (@)
+    _ref_prefixes = (RESOLVED_REF_KEY, EXPR_KEY)  # Only strings with these prefixes can contain references
     allow_missing_reference = allow_missing_reference
     max_resolution_depth = 100  # Prevent DoS from deeply nested references
 
@@ -52,8 +54,14 @@ class Resolver:
         Args:
             items: Optional list of Items to add during initialization
         """
-        self._items: dict[str, Item] = {}
+        self._items: dict[str, Item | LazyItem] = {}
         self._resolved: dict[str, Any] = {}
+        # Reverse reference edges (dep_id -> ids that referenced it), recorded during resolution
+        self._dependents: dict[str, set[str]] = {}
+        # Expressions reading `__local_refs` directly; they may use any ID, so any change makes them stale
+        self._reads_all: set[str] = set()
+        # IDs of import expressions in insertion order (a dict as ordered set); they run before any item
+        self._imports: dict[str, None] = {}
 
         if items:
             for item in items:
@@ -63,16 +71,66 @@ class Resolver:
         """Clear all items and resolved content."""
         self._items = {}
         self._resolved = {}
+        self._dependents = {}
+        self._reads_all = set()
+        self._imports = {}
 
     def is_resolved(self) -> bool:
         """Check if any items have been resolved."""
         return bool(self._resolved)
 
-    def add_item(self, item: Item) -> None:
+    def invalidate(self, ids: Iterable[str]) -> set[str]:
+        """Forget the items whose config changed, together with everything built from them.
+
+        An ID is stale if it is one of `ids`, lies above or below one of them, or (transitively)
+        referenced a stale ID. Stale items are removed along with their resolved values; all
+        other resolved values, including instantiated components, are kept.
+
+        Only recorded dependencies count: `@` references, containment, and expressions that
+        read `__local_refs` directly, which are treated as depending on every ID. Values that
+        depend on a changed item some other way, e.g. through an object shared via globals,
+        keep their old resolved value; resolve with ``lazy=False`` to rebuild everything.
+
+        Args:
+            ids: IDs whose config changed
+
+        Returns:
+            The stale IDs; the caller re-adds fresh Items for those that still exist
+        """
+        sep = self.sep
+
+        def related(a: str, b: str) -> bool:
+            return a == b or a == "" or b == "" or a.startswith(b + sep) or b.startswith(a + sep)
+
+        ids = list(ids)
+        pending = {t for t in self._items.keys() | self._dependents.keys() if any(related(t, c) for c in ids)}
+        if pending:
+            pending |= self._reads_all
+        stale: set[str] = set()
+        while pending:
+            id = pending.pop()
+            if id in stale:
+                continue
+            stale.add(id)
+            pending |= self._dependents.pop(id, set())
+            # Containers embed the resolved values of their children
+            while sep in id:
+                id = id.rsplit(sep, 1)[0]
+                pending.add(id)
+            pending.add("")
+
+        for id in stale:
+            self._items.pop(id, None)
+            self._resolved.pop(id, None)
+            self._imports.pop(id, None)
+        self._reads_all -= stale
+        return stale
+
+    def add_item(self, item: Item | LazyItem) -> None:
         """Add a Item to resolve.
 
         Args:
-            item: Item to add
+            item: Item to add, or a lazy placeholder realized on first use
         """
         id = item.get_id()
         if id in self._items:
@@ -85,8 +143,14 @@ class Resolver:
             )
             return
         self._items[id] = item
+        if isinstance(item, LazyItem):
+            is_import = item.is_import
+        else:
+            is_import = isinstance(item, Expression) and Expression.is_import_statement(item.get_config())
+        if is_import:
+            self._imports[id] = None
 
-    def add_items(self, items: list[Item]) -> None:
+    def add_items(self, items: list[Item | LazyItem]) -> None:
         """Add multiple Items at once.
 
         Args:
@@ -109,7 +173,10 @@ class Resolver:
         id = self.normalize_id(id)
         if resolve and id not in self._resolved:
             self._resolve_one_item(id=id, **kwargs)
-        return self._items.get(id)
+        item = self._items.get(id)
+        if isinstance(item, LazyItem):
+            item = self._items[id] = item.realize()
+        return item
 
     def resolve(
         self,
@@ -173,23 +240,27 @@ class Resolver:
             )
 
         id = self.normalize_id(id)
+        # Bind the hot containers once; they are read repeatedly below and across recursion
+        items = self._items
+        resolved = self._resolved
+        dependents = self._dependents
 
         # Return cached result if available
-        if id in self._resolved:
-            return self._resolved[id]
+        if id in resolved:
+            return resolved[id]
 
         # Look up the item
         try:
-            item = look_up_option(id, self._items, print_all_options=False, default=default or "no_default")
+            item = look_up_option(id, items, print_all_options=False, default=default or "no_default")
         except ValueError as err:
             # Provide helpful error with suggestions
             source_location = None
-            for config_item in self._items.values():
+            for config_item in items.values():
                 if hasattr(config_item, "source_location") and config_item.source_location:
                     source_location = config_item.source_location
                     break
 
-            available_keys = list(self._items.keys())
+            available_keys = list(items.keys())
             config_context = None
 
             # For nested IDs, try to get parent context to show available keys
@@ -210,6 +281,10 @@ class Resolver:
                 config_context=config_context,
             ) from err
 
+        # Create the real item on first use of a lazily parsed node
+        if isinstance(item, LazyItem):
+            item = items[id] = item.realize()
+
         # If default was returned, just return it
         if not isinstance(item, Item):
             return item
@@ -222,12 +297,20 @@ class Resolver:
         waiting_list.add(id)
 
         # First, resolve any import expressions (they need to run first)
-        for t, v in self._items.items():
-            if t not in self._resolved and isinstance(v, Expression) and v.is_import_statement(v.get_config()):
-                self._resolved[t] = v.evaluate() if eval_expr else v
+        for t in self._imports:
+            if t in resolved:
+                continue
+            v = items[t]
+            if isinstance(v, LazyItem):
+                v = items[t] = v.realize()
+            resolved[t] = v.evaluate() if eval_expr else v
 
         # Find all references in this item's config
         refs = self.find_refs_in_config(config=item_config, id=id)
+        if isinstance(item, Expression) and self._vars in item_config:
+            self._reads_all.add(id)  # No @ edge says which IDs it reads
+        for dep_id in refs:
+            dependents.setdefault(dep_id, set()).add(id)
 
         # Resolve dependencies first
         for dep_id in refs.keys():
@@ -239,13 +322,13 @@ class Resolver:
                 )
 
             # Resolve dependency if not already resolved
-            if dep_id not in self._resolved:
+            if dep_id not in resolved:
                 try:
-                    look_up_option(dep_id, self._items, print_all_options=False)
+                    look_up_option(dep_id, items, print_all_options=False)
                 except ValueError as err:
                     msg = f"the referring item `@{dep_id}` is not defined in the config content."
                     if not self.allow_missing_reference:
-                        available_keys = list(self._items.keys())
+                        available_keys = list(items.keys())
                         raise ConfigKeyError(
                             f"Reference '@{dep_id}' not found in configuration",
                             source_location=item.source_location if hasattr(item, "source_location") else None,
@@ -266,18 +349,18 @@ class Resolver:
                 waiting_list.discard(dep_id)
 
         # All dependencies resolved, now resolve this item
-        new_config = self.update_config_with_refs(config=item_config, id=id, refs=self._resolved)
+        new_config = self.update_config_with_refs(config=item_config, id=id, refs=resolved)
         item.update_config(config=new_config)
 
         # Generate final resolved value based on item type
         if isinstance(item, Component):
-            self._resolved[id] = item.instantiate() if instantiate else item
+            resolved[id] = item.instantiate() if instantiate else item
         elif isinstance(item, Expression):
-            self._resolved[id] = item.evaluate(globals={f"{self._vars}": self._resolved}) if eval_expr else item
+            resolved[id] = item.evaluate(globals={f"{self._vars}": resolved}) if eval_expr else item
         else:
-            self._resolved[id] = new_config
+            resolved[id] = new_config
 
-        return self._resolved[id]
+        return resolved[id]
 
     @classmethod
     def normalize_id(cls, id: str | int) -> str:
@@ -318,7 +401,10 @@ class Resolver:
         Yields:
             Tuples of (key, sub_id, value)
         """
-        for k, v in config.items() if isinstance(config, dict) else enumerate(config):
+        # `type() is` is a pointer compare; fall back to isinstance for dict subclasses
+        t = type(config)
+        items = config.items() if t is dict or (t is not list and isinstance(config, dict)) else enumerate(config)
+        for k, v in items:
             sub_id = f"{id}{cls.sep}{k}" if id != "" else f"{k}"
             yield k, sub_id, v
 
@@ -373,14 +459,17 @@ class Resolver:
             Dict of reference IDs to counts
         """
         refs_ = refs or {}
+        t = type(config)
 
-        # Check string values for reference patterns
-        if isinstance(config, str):
+        # Check string values for reference patterns (only expressions and references can hold any)
+        if t is str or (t is not dict and t is not list and isinstance(config, str)):
+            if not config.startswith(cls._ref_prefixes):
+                return refs_
             for ref_id, count in cls.match_refs_pattern(value=config).items():
                 refs_[ref_id] = refs_.get(ref_id, 0) + count
 
         # Recursively search nested structures
-        if isinstance(config, (list, dict)):
+        elif t is dict or t is list or isinstance(config, (list, dict)):
             for _, sub_id, v in cls.iter_subconfigs(id, config):
                 # Instantiable and expression items are also dependencies
                 if (Component.is_instantiable(v) or Expression.is_expression(v)) and sub_id not in refs_:
@@ -402,17 +491,18 @@ class Resolver:
             Config with references replaced
         """
         refs_ = refs or {}
+        t = type(config)
 
-        # Replace references in strings
-        if isinstance(config, str):
-            return cls.update_refs_pattern(config, refs_)
+        # Replace references in strings (plain strings are returned without a regex pass)
+        if t is str or (t is not dict and t is not list and isinstance(config, str)):
+            return cls.update_refs_pattern(config, refs_) if config.startswith(cls._ref_prefixes) else config
 
         # Return non-container types as-is
-        if not isinstance(config, (list, dict)):
+        if t is not dict and t is not list and not isinstance(config, (list, dict)):
             return config
 
         # Recursively update nested structures
-        ret = type(config)()
+        ret = t()
         for idx, sub_id, v in cls.iter_subconfigs(id, config):
             if Component.is_instantiable(v) or Expression.is_expression(v):
                 updated = refs_[sub_id]
@@ -422,7 +512,7 @@ class Resolver:
             else:
                 updated = cls.update_config_with_refs(v, sub_id, refs_)
 
-            if isinstance(ret, dict):
+            if t is dict or isinstance(ret, dict):
                 ret[idx] = updated
             else:
                 ret.append(updated)
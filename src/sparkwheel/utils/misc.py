@@ -1,16 +1,27 @@
+import io
 import os
+import pickle
 import warnings
 from collections.abc import Iterable
+from copy import deepcopy
 from typing import Any, TypeVar
 
-from yaml import SafeLoader
+try:  # libyaml-backed parser and emitter, when PyYAML was built with them
+    from yaml import CSafeDumper as SafeYamlDumper
+    from yaml import CSafeLoader as SafeYamlLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeDumper as SafeYamlDumper
+    from yaml import SafeLoader as SafeYamlLoader
 
 __all__ = [
     "first",
     "issequenceiterable",
     "ensure_tuple",
+    "copy_config",
     "check_key_duplicates",
     "CheckKeyDuplicatesYamlLoader",
+    "SafeYamlLoader",
+    "SafeYamlDumper",
 ]
 
 
@@ -48,6 +59,64 @@ def ensure_tuple(vals: Any) -> tuple:
     return tuple(vals) if issequenceiterable(vals) else (vals,)
 
 
+_IMMUTABLE_LEAVES = (str, int, float, bool, type(None))
+
+
+class _NotPlainData(Exception):
+    """Raised by `_PlainDataPickler` on the first object that is not plain data."""
+
+
+class _PlainDataPickler(pickle.Pickler):
+    """Pickler that gives up on anything but builtin containers and scalars.
+
+    ``reducer_override`` is only consulted for objects the C pickler cannot handle natively,
+    i.e. everything except exact dicts, lists, tuples, sets, strings, bytes and numbers.
+    """
+
+    def reducer_override(self, obj: Any) -> Any:
+        raise _NotPlainData
+
+
+def copy_config(obj: Any) -> Any:
+    """
+    Deep copy plain config data (dicts, lists and scalars) without ``copy.deepcopy``'s memo bookkeeping.
+
+    Plain containers are copied with a C-level pickle round trip; trees holding anything
+    else copy dicts and lists recursively and fall back to ``copy.deepcopy`` for tuples,
+    sets, custom objects and dict/list subclasses. Either way, repeated references to
+    the same container become independent copies. Cyclic plain data is copied with
+    ``copy.deepcopy``, which keeps the cycles and the aliasing.
+
+    Args:
+        obj: config data to copy.
+    """
+    t = type(obj)
+    if t is dict or t is list:
+        buffer = io.BytesIO()
+        pickler = _PlainDataPickler(buffer, pickle.HIGHEST_PROTOCOL)
+        pickler.fast = True  # No memo: shared containers are copied separately, as below
+        try:
+            pickler.dump(obj)
+        except _NotPlainData:
+            return _copy_tree(obj)
+        except ValueError:  # Cyclic data, which fast mode refuses and _copy_tree would recurse on forever
+            return deepcopy(obj)
+        return pickle.loads(buffer.getbuffer())
+    return _copy_tree(obj)
+
+
+def _copy_tree(obj: Any) -> Any:
+    """Recursive `copy_config` for trees that are not entirely plain data."""
+    t = type(obj)
+    if t is dict:
+        return {k: _copy_tree(v) for k, v in obj.items()}
+    if t is list:
+        return [_copy_tree(v) for v in obj]
+    if t in _IMMUTABLE_LEAVES:
+        return obj
+    return deepcopy(obj)
+
+
 def check_key_duplicates(ordered_pairs: list[tuple[Any, Any]]) -> dict[Any, Any]:
     """
     Checks if there is a duplicated key in the sequence of `ordered_pairs`.
@@ -73,7 +142,7 @@ def check_key_duplicates(ordered_pairs: list[tuple[Any, Any]]) -> dict[Any, Any]
     return dict(ordered_pairs)
 
 
-class CheckKeyDuplicatesYamlLoader(SafeLoader):
+class CheckKeyDuplicatesYamlLoader(SafeYamlLoader):
     """
     YAML loader that detects duplicate keys and either warns or raises an error.
     Also tracks line numbers for values to enable better error reporting.
@@ -89,13 +158,17 @@ class CheckKeyDuplicatesYamlLoader(SafeLoader):
         for key_node, _ in node.value:
             key = self.construct_object(key_node, deep=deep)
             if key in mapping:
-                if os.environ.get("SPARKWHEEL_STRICT_KEYS", "0") == "1":
-                    raise ValueError(f"Duplicate key: `{key}`")
-                else:
-                    warnings.warn(f"Duplicate key: `{key}`", stacklevel=2)
+                self.report_duplicate_key(key)
             mapping.add(key)
         return super().construct_mapping(node, deep)
 
+    @staticmethod
+    def report_duplicate_key(key: Any) -> None:
+        """Warn about a duplicated mapping key, or raise ValueError if `SPARKWHEEL_STRICT_KEYS==1`."""
+        if os.environ.get("SPARKWHEEL_STRICT_KEYS", "0") == "1":
+            raise ValueError(f"Duplicate key: `{key}`")
+        warnings.warn(f"Duplicate key: `{key}`", stacklevel=3)
+
     def construct_object(self, node, deep=False):
         """Construct object and attach source location metadata."""
         obj = super().construct_object(node, deep)
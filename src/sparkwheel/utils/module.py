@@ -1,6 +1,6 @@
 import enum
+import functools
 import os
-import pdb  # noqa: T100
 import warnings
 from collections.abc import Collection, Hashable
 from functools import partial
@@ -200,6 +200,24 @@ def optional_import(
     return _LazyRaise(), False
 
 
+def _locate(path: str) -> Any:
+    """`pydoc.locate` with a bounded cache of successful lookups."""
+    try:
+        return _locate_found(path)
+    except LookupError:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _locate_found(path: str) -> Any:
+    """Locate `path`, raising LookupError on a miss so that misses are not cached and a
+    module that becomes importable later is still found."""
+    component = locate(path)
+    if component is None:
+        raise LookupError(path)
+    return component
+
+
 def instantiate(__path: str, __mode: str, **kwargs: Any) -> Any:
     """
     Create an object instance or call a callable object from a class or function represented by ``__path``.
@@ -220,7 +238,7 @@ def instantiate(__path: str, __mode: str, **kwargs: Any) -> Any:
 
         kwargs: keyword arguments to the callable represented by ``__path``.
     """
-    component = locate(__path) if isinstance(__path, str) else __path
+    component = _locate(__path) if isinstance(__path, str) else __path
     if component is None:
         raise ModuleNotFoundError(f"Cannot locate class or function path: '{__path}'.")
     m = look_up_option(__mode, CompInitMode)
@@ -245,6 +263,8 @@ def instantiate(__path: str, __mode: str, **kwargs: Any) -> Any:
                 f"See also Debugger commands documentation: https://docs.python.org/3/library/pdb.html\n",
                 stacklevel=2,
             )
+            import pdb  # noqa: T100
+
             return pdb.runcall(component, **kwargs)
     except Exception as e:
         # Preserve the original exception type and message for better debugging
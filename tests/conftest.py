@@ -0,0 +1,86 @@
+"""Shared pytest fixtures for the sparkwheel test suite."""
+
+import copy
+import json
+import os
+import shutil
+import tempfile
+
+import pytest
+import yaml
+
+from sparkwheel import Config
+from sparkwheel.utils.misc import SafeYamlDumper
+
+# basetemp created under /dev/shm by pytest_configure, removed again at exit
+_tmpfs_basetemp = pytest.StashKey[str]()
+
+# Read-only YAML payloads shared by file-based tests, written once per session
+YAML_PAYLOADS = {
+    "external.yaml": {"external": {"value": 42}},
+}
+
+
+def pytest_configure(config):
+    """Opt in with SPARKWHEEL_TEST_TMPFS=1 to put basetemp in a fresh tmpfs directory for this run."""
+    if os.environ.get("SPARKWHEEL_TEST_TMPFS") == "1" and config.option.basetemp is None and os.access("/dev/shm", os.W_OK):
+        # Unique per run: pytest wipes an explicit basetemp on startup, so a shared one would
+        # delete the files of concurrent runs
+        config.option.basetemp = tempfile.mkdtemp(prefix="sparkwheel-tests-", dir="/dev/shm")
+        config.stash[_tmpfs_basetemp] = config.option.basetemp
+
+
+def pytest_unconfigure(config):
+    """Free the tmpfs basetemp created by pytest_configure."""
+    basetemp = config.stash.get(_tmpfs_basetemp, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+def _dump_yaml(path, obj):
+    """Write `obj` to `path` as YAML with the library's dumper (libyaml when available)."""
+    with open(path, "w") as f:
+        yaml.dump(obj, f, Dumper=SafeYamlDumper)
+    return path
+
+
+@pytest.fixture(scope="session")
+def yaml_files(tmp_path_factory):
+    """Write each canonical YAML payload once and return a name -> path mapping."""
+    root = tmp_path_factory.mktemp("cfg")
+    return {name: _dump_yaml(root / name, payload) for name, payload in YAML_PAYLOADS.items()}
+
+
+@pytest.fixture(scope="session")
+def yaml_file_factory(tmp_path_factory):
+    """Return a helper that writes a read-only YAML file per distinct payload and extension.
+
+    Each (payload, extension) pair is written once per session and its path reused;
+    tests that modify a file should write their own under `tmp_path`.
+    """
+    root = tmp_path_factory.mktemp("payloads")
+    written: dict[tuple[str, str], str] = {}
+
+    def make(obj, ext=".yaml"):
+        key = (json.dumps(obj, sort_keys=True), ext)
+        if key not in written:
+            written[key] = str(_dump_yaml(root / f"payload{len(written)}{ext}", obj))
+        return written[key]
+
+    return make
+
+
+@pytest.fixture
+def parsed_config_factory():
+    """Return a factory of freshly parsed Configs.
+
+    Every call builds a new Config from a private copy of the payload, so no test
+    sees resolution state left behind by another and results never depend on run order.
+    """
+
+    def factory(data: dict) -> Config:
+        config = Config(copy.deepcopy(data))
+        config._parse()
+        return config
+
+    return factory
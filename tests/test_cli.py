@@ -242,27 +242,16 @@ class TestConfigFromCLI:
                 schema=SimpleSchema,
             )
 
-    def test_from_cli_multiple_files(self):
+    def test_from_cli_multiple_files(self, yaml_file_factory):
         """Test loading from multiple files with overrides."""
-        # Create temp config files
-        import os
-        import tempfile
+        base_file = yaml_file_factory({"model": {"lr": 0.01, "hidden_size": 256}})
+        override_file = yaml_file_factory({"model": {"lr": 0.001}})  # Merges by default now!
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            base_file = os.path.join(tmpdir, "base.yaml")
-            override_file = os.path.join(tmpdir, "override.yaml")
+        config = Config.from_cli([base_file, override_file], ["model::dropout=0.1"])
 
-            with open(base_file, "w") as f:
-                f.write("model:\n  lr: 0.01\n  hidden_size: 256\n")
-
-            with open(override_file, "w") as f:
-                f.write("model:\n  lr: 0.001\n")  # Merges by default now!
-
-            config = Config.from_cli([base_file, override_file], ["model::dropout=0.1"])
-
-            assert config["model::lr"] == 0.001  # From override file
-            assert config["model::hidden_size"] == 256  # From base
-            assert config["model::dropout"] == 0.1  # From CLI
+        assert config["model::lr"] == 0.001  # From override file
+        assert config["model::hidden_size"] == 256  # From base
+        assert config["model::dropout"] == 0.1  # From CLI
 
     def test_from_cli_with_references(self):
         """Test that references work with CLI overrides."""
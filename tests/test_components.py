@@ -20,6 +20,7 @@ from sparkwheel import (
     Item,
     Resolver,
 )
+from sparkwheel.utils.exceptions import CircularReferenceError, ConfigKeyError, EvaluationError
 
 
 class TestItem:
@@ -205,7 +206,7 @@ class TestExpression:
         """Test is_import_statement with import."""
         assert Expression.is_import_statement(stmt) is True
 
-    @pytest.mark.parametrize("value", ["$1 + 1", "normal string"])
+    @pytest.mark.parametrize("value", ["$1 + 1", "normal string", "$importlib.import_module('os')", "$from_value + 1"])
     def test_is_import_statement_false(self, value):
         """Test is_import_statement with non-import."""
         assert Expression.is_import_statement(value) is False
@@ -292,8 +293,6 @@ class TestExpression:
 
     def test_evaluate_error_handling(self):
         """Test evaluate error handling."""
-        from sparkwheel.utils.exceptions import EvaluationError
-
         expr = Expression("$undefined_variable", id="test")
         with pytest.raises(EvaluationError, match="Failed to evaluate"):
             expr.evaluate()
@@ -556,6 +555,17 @@ class TestResolver:
         result = Resolver.update_refs_pattern("$@value * 2", refs)
         assert result == "$__local_refs['value'] * 2"
 
+    def test_update_refs_pattern_expression_without_refs(self):
+        """Test update_refs_pattern leaves expressions without references unchanged."""
+        result = Resolver.update_refs_pattern("$len([1, 2, 3])", {})
+        assert result == "$len([1, 2, 3])"
+
+    def test_update_config_with_refs_plain_strings(self):
+        """Test update_config_with_refs passes plain strings through untouched."""
+        config = {"name": "plain", "email": "user@example.com", "ref": "@value"}
+        result = Resolver.update_config_with_refs(config, "", {"value": 1})
+        assert result == {"name": "plain", "email": "user@example.com", "ref": 1}
+
     def test_update_refs_pattern_multiple(self):
         """Test update_refs_pattern with multiple references."""
         refs = {"a": 1, "b": 2}
@@ -672,8 +682,6 @@ class TestResolver:
 
     def test_resolve_one_item_circular_reference(self):
         """Test _resolve_one_item detects circular references."""
-        from sparkwheel.utils.exceptions import CircularReferenceError
-
         resolver = Resolver()
         resolver.add_item(Item({"ref": "@b"}, id="a"))
         resolver.add_item(Item({"ref": "@a"}, id="b"))
@@ -682,8 +690,6 @@ class TestResolver:
 
     def test_resolve_one_item_missing_reference_error(self):
         """Test _resolve_one_item raises error for missing reference."""
-        from sparkwheel.utils.exceptions import ConfigKeyError
-
         resolver = Resolver()
         resolver.add_item(Item({"ref": "@missing"}, id="test"))
         with pytest.raises(ConfigKeyError, match="not found"):
@@ -761,8 +767,6 @@ class TestResolver:
 
     def test_resolve_one_item_not_found(self):
         """Test _resolve_one_item with non-existent id."""
-        from sparkwheel.utils.exceptions import ConfigKeyError
-
         resolver = Resolver()
         with pytest.raises(ConfigKeyError, match="not found"):
             resolver._resolve_one_item("nonexistent")
@@ -12,26 +12,67 @@ This module contains all tests for the Config class, organized by functionality:
 - Advanced features (lazy parsing, relative IDs, etc.)
 """
 
-import tempfile
-from pathlib import Path
+import copy
+import io
+import re
+import sys
+from collections import OrderedDict, UserString
 
 import pytest
-import yaml
 
-from sparkwheel import Config, apply_operators
+from sparkwheel import Component, Config, Expression, Item, apply_operators
+from sparkwheel.metadata import MetadataRegistry
+from sparkwheel.parser import Parser
 from sparkwheel.path_patterns import split_file_and_id
 from sparkwheel.path_utils import resolve_relative_ids
+from sparkwheel.utils.exceptions import ConfigKeyError, ConfigMergeError
+
+# Error messages, compiled once at import and passed to pytest.raises(match=...)
+NON_CONTAINER_ERROR = re.compile(r"Config must be dict or list")
+RELATIVE_ID_OUT_OF_RANGE_ERROR = re.compile(r"attempts to go")
+REMOVE_OPERATOR_VALUE_ERROR = re.compile(r"Remove operator '~[^']+' must have null, empty, or list value")
+INDEX_OUT_OF_RANGE_ERROR = re.compile(r"index 5 out of range")
+NEGATIVE_INDEX_OUT_OF_RANGE_ERROR = re.compile(r"index -10 out of range")
+NON_INTEGER_INDEX_ERROR = re.compile(r"index must be integer")
+EMPTY_REMOVE_LIST_ERROR = re.compile(r"cannot be empty")
+NONEXISTENT_KEY_ERROR = re.compile(r"Cannot remove non-existent key 'dropout' from 'model'")
+NON_COLLECTION_ERROR = re.compile(r"expected list or dict")
+
+
+# Prototype payload for the merge tests; each test gets its own deep copy
+BASE_DATA = {"a": 1, "b": {"x": 1, "y": 2}}
+
+
+@pytest.fixture
+def base_cfg():
+    """Return a fresh Config over a private copy of BASE_DATA (tests mutate it via update)."""
+    return Config.load(copy.deepcopy(BASE_DATA))
+
+
+@pytest.fixture(scope="class")
+def ro_cfg():
+    """Return one Config shared by a class's read-only tests (must not be mutated)."""
+    return Config(
+        {
+            "key1": "value1",
+            "key2": 42,
+            "exists": True,
+            "a": {"b": {"c": 1}},
+            "existing": "value",
+            "scalar": 42,
+            "items": [10, 20, 30],
+            "key": "value",
+        }
+    )
 
 
 class TestConfigBasics:
     """Test basic Config operations."""
 
-    def test_basic_config(self):
+    def test_basic_config(self, ro_cfg):
         """Test basic configuration parsing."""
-        config = {"key1": "value1", "key2": 42}
-        parser = Config(config)
-        assert parser["key1"] == "value1"
-        assert parser["key2"] == 42
+        assert ro_cfg["key1"] == "value1"
+        assert ro_cfg["key2"] == 42
 
     def test_set_and_get(self):
         """Test setting and getting config values."""
@@ -56,31 +97,26 @@ class TestConfigBasics:
         parser["model::nested::deep::value"] = 42
         assert parser["model"]["nested"]["deep"]["value"] == 42
 
-    def test_contains(self):
+    def test_contains(self, ro_cfg):
         """Test __contains__ method."""
-        config = {"exists": True}
-        parser = Config(config)
-        assert "exists" in parser
-        assert "not_exists" not in parser
+        assert "exists" in ro_cfg
+        assert "not_exists" not in ro_cfg
 
-    def test_contains_nested(self):
+    def test_contains_nested(self, ro_cfg):
         """Test __contains__ with nested path."""
-        parser = Config({"a": {"b": {"c": 1}}})
-        assert "a" in parser
-        assert "a::b" in parser
-        assert "a::b::c" in parser
-        assert "a::b::d" not in parser
+        assert "a" in ro_cfg
+        assert "a::b" in ro_cfg
+        assert "a::b::c" in ro_cfg
+        assert "a::b::d" not in ro_cfg
 
-    def test_get_with_default(self):
+    def test_get_with_default(self, ro_cfg):
         """Test get method with default."""
-        parser = Config({"existing": "value"})
-        assert parser.get("existing") == "value"
-        assert parser.get("missing", "default") == "default"
+        assert ro_cfg.get("existing") == "value"
+        assert ro_cfg.get("missing", "default") == "default"
 
-    def test_get_invalid_key_default(self):
+    def test_get_invalid_key_default(self, ro_cfg):
         """Test get returns default for invalid key."""
-        parser = Config({"a": {"b": 1}})
-        assert parser.get("a::b::c", "default") == "default"
+        assert ro_cfg.get("a::b::c::d", "default") == "default"
 
     def test_setitem_empty_id(self):
         """Test __setitem__ with empty id."""
@@ -96,18 +132,16 @@ class TestConfigBasics:
         assert parser["b::c"] == 20
         assert parser["d"] == 30
 
-    def test_getitem_invalid_config_type(self):
+    def test_getitem_invalid_config_type(self, ro_cfg):
         """Test __getitem__ raises error for invalid config type."""
-        parser = Config({"scalar": 42})
-        with pytest.raises(ValueError, match="Config must be dict or list"):
-            _ = parser["scalar::invalid"]
+        with pytest.raises(ValueError, match=NON_CONTAINER_ERROR):
+            _ = ro_cfg["scalar::invalid"]
 
-    def test_getitem_list_indexing(self):
+    def test_getitem_list_indexing(self, ro_cfg):
         """Test __getitem__ with list indexing."""
-        parser = Config({"items": [10, 20, 30]})
-        assert parser["items::0"] == 10
-        assert parser["items::1"] == 20
-        assert parser["items::2"] == 30
+        assert ro_cfg["items::0"] == 10
+        assert ro_cfg["items::1"] == 20
+        assert ro_cfg["items::2"] == 30
 
     def test_setitem_list_indexing(self):
         """Test __setitem__ with list indexing."""
@@ -115,10 +149,9 @@ class TestConfigBasics:
         parser["items::1"] = 99
         assert parser["items::1"] == 99
 
-    def test_repr(self):
+    def test_repr(self, ro_cfg):
         """Test Config __repr__."""
-        parser = Config({"key": "value"})
-        repr_str = repr(parser)
+        repr_str = repr(ro_cfg)
         assert "key" in repr_str
 
     def test_init_with_none(self):
@@ -143,17 +176,15 @@ class TestConfigBasics:
 class TestConfigReferences:
     """Test reference resolution."""
 
-    def test_simple_reference(self):
+    def test_simple_reference(self, parsed_config_factory):
         """Test simple reference resolution."""
-        config = {"value": 10, "reference": "@value"}
-        parser = Config.load(config)
+        parser = parsed_config_factory({"value": 10, "reference": "@value"})
         result = parser.resolve("reference")
         assert result == 10
 
-    def test_nested_reference(self):
+    def test_nested_reference(self, parsed_config_factory):
         """Test nested reference with ::."""
-        config = {"nested": {"value": 100}, "ref": "@nested::value"}
-        parser = Config.load(config)
+        parser = parsed_config_factory({"nested": {"value": 100}, "ref": "@nested::value"})
         result = parser.resolve("ref")
         assert result == 100
 
@@ -165,48 +196,34 @@ class TestConfigReferences:
         result = parser.resolve("ref")
         assert result == 3
 
-    def test_multiple_references(self):
+    def test_multiple_references(self, parsed_config_factory):
         """Test multiple references in one expression."""
-        config = {"a": 10, "b": 20, "sum": "$@a + @b"}
-        parser = Config.load(config)
+        parser = parsed_config_factory({"a": 10, "b": 20, "sum": "$@a + @b"})
         result = parser.resolve("sum")
         assert result == 30
 
-    def test_resolve_relative_ids(self):
-        """Test resolve_relative_ids method."""
-        result = resolve_relative_ids("parent::child", "@::sibling")
-        assert result == "@parent::sibling"
-
-    def test_resolve_relative_ids_double_colon(self):
-        """Test resolve_relative_ids with :: (up one level)."""
-        result = resolve_relative_ids("parent::child", "@::::value")
-        assert result == "@value"
-
-    def test_resolve_relative_ids_triple_colon(self):
-        """Test resolve_relative_ids with :::: (up two levels)."""
-        result = resolve_relative_ids("a::b::c", "@::::::value")
-        assert result == "@value"
-
-    def test_resolve_relative_ids_equal_levels(self):
-        """Test resolve_relative_ids when going up equals depth."""
-        result = resolve_relative_ids("a::b", "@::::value")
-        assert result == "@value"
+    @pytest.mark.parametrize(
+        "current_id,value,expected",
+        [
+            pytest.param("parent::child", "@::sibling", "@parent::sibling", id="sibling"),
+            pytest.param("parent::child", "@::::value", "@value", id="up_one_level"),
+            pytest.param("a::b::c", "@::::::value", "@value", id="up_two_levels"),
+            pytest.param("a::b", "@::::value", "@value", id="equal_levels"),
+            pytest.param("parent::child", "%::sibling", "%parent::sibling", id="macro"),
+            pytest.param("parent::items::1", "@::0", "@parent::items::0", id="in_list"),
+            pytest.param("a::b::c", "$@::x + @::::y + @::x", "$@a::b::x + @a::y + @a::b::x", id="mixed_levels"),
+            pytest.param("a::b", "$@a::b + 1", "$@a::b + 1", id="absolute_only"),
+        ],
+    )
+    def test_resolve_relative_ids(self, current_id, value, expected):
+        """Test resolve_relative_ids converts relative references to absolute ones."""
+        assert resolve_relative_ids(current_id, value) == expected
 
     def test_resolve_relative_ids_out_of_range(self):
         """Test resolve_relative_ids raises error when out of range."""
-        with pytest.raises(ValueError, match="attempts to go"):
+        with pytest.raises(ValueError, match=RELATIVE_ID_OUT_OF_RANGE_ERROR):
             resolve_relative_ids("a", "@::::value")
 
-    def test_resolve_relative_ids_macro(self):
-        """Test resolve_relative_ids with macro %."""
-        result = resolve_relative_ids("parent::child", "%::sibling")
-        assert result == "%parent::sibling"
-
-    def test_resolve_relative_ids_in_list(self):
-        """Test resolve_relative_ids in list context."""
-        result = resolve_relative_ids("parent::items::1", "@::0")
-        assert result == "@parent::items::0"
-
 
 class TestExpressions:
     """Test expression evaluation."""
@@ -253,18 +270,27 @@ class TestConfigMacros:
         parser["copy"]["a"] = 99
         assert parser["template"]["a"] == 1
 
-    def test_do_resolve_macro_load(self):
-        """Test preprocessing with macro from file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.safe_dump({"external": {"value": 42}}, f)
-            filepath = f.name
+    def test_macro_scalar_is_shared_not_copied(self):
+        """Test that macros pointing at immutable values reuse the same object."""
+        original = "a long string value that would be duplicated by a serializing copy"
+        parser = Config({"original": original, "copy": "%original"})
+        parser._parse()
+        assert parser["copy"] is original
 
-        try:
-            parser = Config({"local": f"%{filepath}::external"})
-            parser._parse()
-            assert parser["local"] == {"value": 42}
-        finally:
-            Path(filepath).unlink()
+    def test_macro_nested_containers_are_independent(self):
+        """Test that mutating a nested level of a macro copy leaves the template untouched."""
+        parser = Config({"template": {"layers": [{"size": 8}]}, "copy": "%template"})
+        parser._parse()
+        parser["copy"]["layers"][0]["size"] = 16
+        parser["copy"]["layers"].append({"size": 32})
+        assert parser["template"] == {"layers": [{"size": 8}]}
+
+    @pytest.mark.filesystem
+    def test_do_resolve_macro_load(self, yaml_files):
+        """Test preprocessing with macro from file."""
+        parser = Config({"local": f"%{yaml_files['external.yaml']}::external"})
+        parser._parse()
+        assert parser["local"] == {"value": 42}
 
 
 class TestComponents:
@@ -304,71 +330,66 @@ class TestConfigFileOperations:
         assert parser["key"] == "value"
         assert parser["num"] == 42
 
-    def test_load_from_single_file(self, tmp_path):
-        """Test loading from single YAML file."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("key: value\nnum: 42")
-
-        parser = Config.load(str(config_file))
+    @pytest.mark.filesystem
+    @pytest.mark.parametrize("payload", [{"key": "value", "num": 42}, {"test": True}])
+    @pytest.mark.parametrize("ext", [".yaml", ".yml", ".YAML", ".YML"])
+    def test_load_from_single_file(self, yaml_file_factory, ext, payload):
+        """Test loading from single YAML file, with any casing of either extension."""
+        parser = Config.load(yaml_file_factory(payload, ext=ext))
+        assert all(parser[key] == value for key, value in payload.items())
+
+    def test_loads_single_document(self):
+        """Test loading from a YAML string without touching the filesystem."""
+        parser = Config.loads("key: value\nnum: 42")
         assert parser["key"] == "value"
         assert parser["num"] == 42
 
-    def test_load_from_multiple_files(self, tmp_path):
-        """Test loading from multiple YAML files with merging (composition-by-default)."""
-        base_file = tmp_path / "base.yaml"
-        base_file.write_text("a: 1\nb:\n  x: 1\n  y: 2")
+    def test_loads_first_document_is_not_copied(self, monkeypatch):
+        """Test the first loaded document becomes the config data without a merge copy."""
+        monkeypatch.setattr("sparkwheel.config.apply_operators", pytest.fail)
+        assert Config.loads("a:\n  b: 1")["a"] == {"b": 1}
 
-        override_file = tmp_path / "override.yaml"
-        override_file.write_text("b:\n  z: 3")  # Merges by default now!
+        monkeypatch.undo()
+        assert Config.loads("~a: null\nb: 2")._data == {"b": 2}  # Top-level operators still apply
 
-        parser = Config.load([str(base_file), str(override_file)])
+    def test_loads_multiple_documents(self):
+        """Test loading from multiple YAML strings with merging (composition-by-default)."""
+        parser = Config.loads(["a: 1\nb:\n  x: 1\n  y: 2", "b:\n  z: 3"])  # Merges by default now!
+        b = parser["b"]
         assert parser["a"] == 1
-        assert parser["b"]["x"] == 1  # Preserved
-        assert parser["b"]["y"] == 2  # Preserved
-        assert parser["b"]["z"] == 3  # Added
-
-    def test_load_uppercase_yaml(self):
-        """Test loading .YML file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".YML", delete=False) as f:
-            yaml.safe_dump({"test": 1}, f)
-            filepath = f.name
-
-        try:
-            parser = Config.load(filepath)
-            assert parser["test"] == 1
-        finally:
-            Path(filepath).unlink()
-
-    def test_export_config_file(self):
+        assert b["x"] == 1  # Preserved
+        assert b["y"] == 2  # Preserved
+        assert b["z"] == 3  # Added
+
+    @pytest.mark.filesystem
+    def test_export_config_file(self, tmp_path):
         """Test export_config_file."""
         config = {"key": "value", "number": 42, "nested": {"a": 1}}
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            filepath = f.name
-
-        try:
-            Config.export_config_file(config, filepath)
-            loaded_parser = Config.load(filepath)
-            assert loaded_parser._data == config
-        finally:
-            Path(filepath).unlink()
-
-    def test_split_path_id_with_path(self):
-        """Test split_path_id with file path and id."""
-        path, ids = split_file_and_id("/path/to/config.yaml::key::subkey")
-        assert path == "/path/to/config.yaml"
-        assert ids == "key::subkey"
-
-    def test_split_path_id_with_path_no_id(self):
-        """Test split_path_id with file path but no id."""
-        path, ids = split_file_and_id("/path/to/config.yml")
-        assert path == "/path/to/config.yml"
-        assert ids == ""
-
-    def test_split_path_id_no_path(self):
-        """Test split_path_id with only id."""
-        path, ids = split_file_and_id("key::subkey")
-        assert path == ""
-        assert ids == "key::subkey"
+        filepath = tmp_path / "exported.yaml"
+
+        Config.export_config_file(config, filepath)
+        loaded_parser = Config.load(str(filepath))
+        assert loaded_parser._data == config
+
+    def test_export_config_file_to_stream(self):
+        """Test export_config_file writes to an open text stream."""
+        config = {"key": "value", "number": 42, "nested": {"a": 1}}
+        stream = io.StringIO()
+
+        Config.export_config_file(config, stream)
+        assert Config.loads(stream.getvalue())._data == config
+
+    @pytest.mark.parametrize(
+        "value,expected_path,expected_ids",
+        [
+            pytest.param("/path/to/config.yaml::key::subkey", "/path/to/config.yaml", "key::subkey", id="path_and_id"),
+            pytest.param("/path/to/config.yml", "/path/to/config.yml", "", id="path_no_id"),
+            pytest.param("key::subkey", "", "key::subkey", id="id_no_path"),
+        ],
+    )
+    def test_split_path_id(self, value, expected_path, expected_ids):
+        """Test split_file_and_id separates the file path from the id."""
+        assert split_file_and_id(value) == (expected_path, expected_ids)
 
 
 class TestConfigMerging:
@@ -404,11 +425,31 @@ class TestConfigMerging:
         override = {"model": {"dropout": 0.1, "optimizer": {"nested": {"b": 2}, "~type": None}}}
         result = apply_operators(base, override)
 
-        assert result["model"]["lr"] == 0.001  # Preserved
-        assert result["model"]["hidden_size"] == 512  # Preserved
-        assert result["model"]["dropout"] == 0.1  # Added
-        assert result["model"]["optimizer"]["nested"] == {"a": 1, "b": 2}  # Merged
-        assert "type" not in result["model"]["optimizer"]  # Deleted
+        model = result["model"]
+        opt = model["optimizer"]
+        assert model["lr"] == 0.001  # Preserved
+        assert model["hidden_size"] == 512  # Preserved
+        assert model["dropout"] == 0.1  # Added
+        assert opt["nested"] == {"a": 1, "b": 2}  # Merged
+        assert "type" not in opt  # Deleted
+
+    def test_nested_merge_leaves_inputs_untouched(self):
+        """Test that in-place merging only touches the private copy of base."""
+        base = {"model": {"optimizer": {"lr": 0.1, "betas": [0.9]}, "layers": [1]}}
+        override = {"model": {"optimizer": {"lr": 0.01, "betas": [0.99]}, "layers": [2]}}
+        base_before = copy.deepcopy(base)
+        override_before = copy.deepcopy(override)
+
+        result = apply_operators(base, override)
+
+        assert result == {"model": {"optimizer": {"lr": 0.01, "betas": [0.9, 0.99]}, "layers": [1, 2]}}
+        assert base == base_before
+        assert override == override_before
+
+    def test_nested_merge_applies_before_later_siblings(self):
+        """Test a nested merge is finished before the operators on later keys run."""
+        result = apply_operators({"a": {"y": 1}}, {"a": {"x": 1}, "~a": ["x"]})
+        assert result == {"a": {"y": 1}}
 
     def test_explicit_replace_operator(self):
         """Test that = operator explicitly replaces sections."""
@@ -418,45 +459,48 @@ class TestConfigMerging:
         # With = operator, replaces entirely
         assert result == {"training": {"epochs": 100}}
 
-    def test_merge_dict(self):
+    def test_merge_dict(self, base_cfg):
         """Test merging a dict (merges by default)."""
-        parser = Config.load({"a": 1, "b": {"x": 1, "y": 2}})
+        parser = base_cfg
         parser.update({"b": {"z": 3}})
 
+        b = parser["b"]
         assert parser["a"] == 1
-        assert parser["b"]["x"] == 1  # Preserved
-        assert parser["b"]["y"] == 2  # Preserved
-        assert parser["b"]["z"] == 3  # Added
+        assert b["x"] == 1  # Preserved
+        assert b["y"] == 2  # Preserved
+        assert b["z"] == 3  # Added
 
-    def test_merge_file(self, tmp_path):
+    @pytest.mark.filesystem
+    def test_merge_file(self, base_cfg, yaml_file_factory):
         """Test merging from file (composition-by-default)."""
-        parser = Config.load({"a": 1, "b": {"x": 1, "y": 2}})
+        parser = base_cfg
 
-        override_file = tmp_path / "override.yaml"
-        override_file.write_text("b:\n  z: 3")  # Merges by default!
+        override_file = yaml_file_factory({"b": {"z": 3}})  # Merges by default!
 
-        parser.update(str(override_file))
-        assert parser["b"]["x"] == 1
-        assert parser["b"]["y"] == 2
-        assert parser["b"]["z"] == 3
+        parser.update(override_file)
+        b = parser["b"]
+        assert b["x"] == 1
+        assert b["y"] == 2
+        assert b["z"] == 3
 
-    def test_merge_config_instance(self):
+    def test_merge_config_instance(self, base_cfg):
         """Test merging another Config instance (merges by default now!)."""
-        config1 = Config.load({"a": 1, "b": {"x": 1, "y": 2}})
+        config1 = base_cfg
         config2 = Config.load({"b": {"z": 3}, "c": 4})
 
         config1.update(config2)
 
         assert config1["a"] == 1
         # NEW: b is merged by default!
-        assert config1["b"]["x"] == 1  # Preserved
-        assert config1["b"]["y"] == 2  # Preserved
-        assert config1["b"]["z"] == 3  # Added
+        b = config1["b"]
+        assert b["x"] == 1  # Preserved
+        assert b["y"] == 2  # Preserved
+        assert b["z"] == 3  # Added
         assert config1["c"] == 4
 
-    def test_merge_config_instance_with_replace(self):
+    def test_merge_config_instance_with_replace(self, base_cfg):
         """Test merging Config instance with = replace operator."""
-        config1 = Config.load({"a": 1, "b": {"x": 1, "y": 2}})
+        config1 = base_cfg
         config2 = Config.load({"=b": {"z": 3}, "c": 4})
 
         config1.update(config2)
@@ -473,8 +517,9 @@ class TestConfigMerging:
 
         base_config.update(cli_config)
 
-        assert base_config["model"]["lr"] == 0.01
-        assert base_config["model"]["hidden_size"] == 256
+        model = base_config["model"]
+        assert model["lr"] == 0.01
+        assert model["hidden_size"] == 256
         assert base_config["trainer"]["max_epochs"] == 50
 
     def test_merge_config_with_references(self):
@@ -516,28 +561,24 @@ class TestConfigMerging:
         assert parser["model"]["lr"] == 0.001
         assert "dropout" not in parser["model"]
 
-    def test_merge_delete_directive_with_non_null_value_raises_error(self):
+    @pytest.mark.parametrize(
+        "data,update",
+        [
+            pytest.param({"a": 1, "b": 2}, {"~b": {"nested": "value"}}, id="top_level"),
+            pytest.param({"model": {"lr": 0.001, "dropout": 0.1}}, {"~model::dropout": 42}, id="nested_path"),
+        ],
+    )
+    def test_merge_delete_directive_with_non_null_value_raises_error(self, data, update):
         """Test that Config.update() with ~key raises error when value is not null, empty, or list."""
-        from sparkwheel.utils.exceptions import ConfigMergeError
+        parser = Config.load(data)
+        with pytest.raises(ConfigMergeError, match=REMOVE_OPERATOR_VALUE_ERROR):
+            parser.update(update)
 
+    @pytest.mark.parametrize("value", [None, ""], ids=["null", "empty"])
+    def test_merge_delete_directive_with_null_or_empty_value(self, value):
+        """Test that Config.update() with ~key accepts null and empty values."""
         parser = Config.load({"a": 1, "b": 2})
-
-        # Test with non-null value
-        with pytest.raises(ConfigMergeError, match="Remove operator '~b' must have null, empty, or list value"):
-            parser.update({"~b": {"nested": "value"}})
-
-        # Test with nested path and non-null value
-        parser = Config.load({"model": {"lr": 0.001, "dropout": 0.1}})
-        with pytest.raises(ConfigMergeError, match="Remove operator '~model::dropout' must have null, empty, or list value"):
-            parser.update({"~model::dropout": 42})
-
-        # But null and empty should work
-        parser = Config.load({"a": 1, "b": 2})
-        parser.update({"~b": None})
-        assert "b" not in parser
-
-        parser = Config.load({"a": 1, "b": 2})
-        parser.update({"~b": ""})
+        parser.update({"~b": value})
         assert "b" not in parser
 
     def test_merge_combined_operators(self):
@@ -565,41 +606,20 @@ class TestConfigMerging:
         result = apply_operators(base, override)
         assert result == {"a": 1}
 
-    def test_delete_directive_with_invalid_value_raises_error(self):
+    @pytest.mark.parametrize(
+        "value",
+        [{"nested": "value"}, "value", 42, False],
+        ids=["dict", "string", "number", "bool"],
+    )
+    def test_delete_directive_with_invalid_value_raises_error(self, value):
         """Test that ~key raises error when value is not null, empty, or list."""
-        from sparkwheel.utils.exceptions import ConfigMergeError
-
-        base = {"a": 1, "b": 2}
-
-        # Test with dict value
-        override = {"~b": {"nested": "value"}}
-        with pytest.raises(ConfigMergeError, match="Remove operator '~b' must have null, empty, or list value"):
-            apply_operators(base, override)
-
-        # Test with string value
-        override = {"~b": "value"}
-        with pytest.raises(ConfigMergeError, match="Remove operator '~b' must have null, empty, or list value"):
-            apply_operators(base, override)
-
-        # Test with number value
-        override = {"~b": 42}
-        with pytest.raises(ConfigMergeError, match="Remove operator '~b' must have null, empty, or list value"):
-            apply_operators(base, override)
+        with pytest.raises(ConfigMergeError, match=REMOVE_OPERATOR_VALUE_ERROR):
+            apply_operators({"a": 1, "b": 2}, {"~b": value})
 
-        # Test with boolean value
-        override = {"~b": False}
-        with pytest.raises(ConfigMergeError, match="Remove operator '~b' must have null, empty, or list value"):
-            apply_operators(base, override)
-
-        # But null, empty, and list should work
-        override = {"~b": None}
-        result = apply_operators(base, override)
-        assert result == {"a": 1}
-
-        base = {"a": 1, "b": 2}
-        override = {"~b": ""}
-        result = apply_operators(base, override)
-        assert result == {"a": 1}
+    @pytest.mark.parametrize("value", [None, ""], ids=["null", "empty"])
+    def test_delete_directive_with_null_or_empty_value(self, value):
+        """Test that ~key accepts null and empty values."""
+        assert apply_operators({"a": 1, "b": 2}, {"~b": value}) == {"a": 1}
 
     def test_merge_into_empty_dict(self):
         """Test that merging into an empty dict works."""
@@ -609,119 +629,66 @@ class TestConfigMerging:
 
         assert result == {"model": {"hidden_size": 512}}
 
-    def test_delete_list_items_by_index(self):
-        """Test deleting items from list by index."""
-        base = {"plugins": ["logger", "metrics", "cache", "auth", "debug"]}
-        override = {"~plugins": [0, 2, 4]}
-        result = apply_operators(base, override)
-
-        # Indices 0, 2, 4 deleted -> "logger", "cache", "debug" removed
-        assert result == {"plugins": ["metrics", "auth"]}
-
-    def test_delete_list_items_single_index(self):
-        """Test deleting single item from list."""
-        base = {"items": ["a", "b", "c"]}
-        override = {"~items": [1]}
-        result = apply_operators(base, override)
-
-        assert result == {"items": ["a", "c"]}
-
-    def test_delete_list_items_negative_index(self):
-        """Test deleting list items with negative indices."""
-        base = {"items": ["a", "b", "c", "d", "e"]}
-        override = {"~items": [-1, -2]}
-        result = apply_operators(base, override)
-
-        # -1 is "e", -2 is "d"
-        assert result == {"items": ["a", "b", "c"]}
-
-    def test_delete_list_items_mixed_indices(self):
-        """Test deleting list items with mixed positive and negative indices."""
-        base = {"items": ["a", "b", "c", "d", "e"]}
-        override = {"~items": [0, -1]}
-        result = apply_operators(base, override)
-
-        # 0 is "a", -1 is "e"
-        assert result == {"items": ["b", "c", "d"]}
-
-    def test_delete_list_items_duplicate_indices(self):
-        """Test that duplicate indices are handled correctly."""
-        base = {"items": ["a", "b", "c"]}
-        override = {"~items": [1, 1, 1]}
-        result = apply_operators(base, override)
-
-        # Should only delete index 1 once
-        assert result == {"items": ["a", "c"]}
-
-    def test_delete_list_items_out_of_bounds_error(self):
-        """Test that out of bounds index raises error."""
-        from sparkwheel.utils.exceptions import ConfigMergeError
-
-        base = {"items": ["a", "b", "c"]}
-        override = {"~items": [5]}
-
-        with pytest.raises(ConfigMergeError, match="index 5 out of range"):
-            apply_operators(base, override)
-
-        # Test negative out of bounds
-        override = {"~items": [-10]}
-        with pytest.raises(ConfigMergeError, match="index -10 out of range"):
-            apply_operators(base, override)
-
-    def test_delete_list_items_non_integer_error(self):
-        """Test that non-integer index raises error."""
-        from sparkwheel.utils.exceptions import ConfigMergeError
-
-        base = {"items": ["a", "b", "c"]}
-        override = {"~items": ["a"]}
-
-        with pytest.raises(ConfigMergeError, match="index must be integer"):
-            apply_operators(base, override)
-
-    def test_delete_list_items_empty_list_error(self):
-        """Test that empty list raises error."""
-        from sparkwheel.utils.exceptions import ConfigMergeError
-
-        base = {"items": ["a", "b", "c"]}
-        override = {"~items": []}
-
-        with pytest.raises(ConfigMergeError, match="cannot be empty"):
-            apply_operators(base, override)
-
-    def test_delete_dict_keys(self):
-        """Test deleting keys from dict."""
-        base = {"dataloaders": {"train": {"batch_size": 32}, "val": {"batch_size": 16}, "test": {"batch_size": 8}}}
-        override = {"~dataloaders": ["train", "test"]}
-        result = apply_operators(base, override)
-
-        assert result == {"dataloaders": {"val": {"batch_size": 16}}}
-
-    def test_delete_dict_keys_single(self):
-        """Test deleting single key from dict."""
-        base = {"model": {"dropout": 0.1, "lr": 0.001}}
-        override = {"~model": ["dropout"]}
-        result = apply_operators(base, override)
-
-        assert result == {"model": {"lr": 0.001}}
-
-    def test_delete_dict_keys_nonexistent_error(self):
-        """Test that deleting non-existent key raises error."""
-        from sparkwheel.utils.exceptions import ConfigMergeError
-
-        base = {"model": {"lr": 0.001}}
-        override = {"~model": ["dropout"]}
-
-        with pytest.raises(ConfigMergeError, match="Cannot remove non-existent key 'dropout' from 'model'"):
-            apply_operators(base, override)
-
-    def test_delete_items_from_non_collection_error(self):
-        """Test that deleting items from non-list/dict raises error."""
-        from sparkwheel.utils.exceptions import ConfigMergeError
-
-        base = {"value": 42}
-        override = {"~value": [0]}
-
-        with pytest.raises(ConfigMergeError, match="expected list or dict"):
+    @pytest.mark.parametrize(
+        "base,override,expected",
+        [
+            # Indices 0, 2, 4 deleted -> "logger", "cache", "debug" removed
+            pytest.param(
+                {"plugins": ["logger", "metrics", "cache", "auth", "debug"]},
+                {"~plugins": [0, 2, 4]},
+                {"plugins": ["metrics", "auth"]},
+                id="list_by_index",
+            ),
+            pytest.param({"items": ["a", "b", "c"]}, {"~items": [1]}, {"items": ["a", "c"]}, id="list_single_index"),
+            # -1 is "e", -2 is "d"
+            pytest.param(
+                {"items": ["a", "b", "c", "d", "e"]},
+                {"~items": [-1, -2]},
+                {"items": ["a", "b", "c"]},
+                id="list_negative_index",
+            ),
+            # 0 is "a", -1 is "e"
+            pytest.param(
+                {"items": ["a", "b", "c", "d", "e"]}, {"~items": [0, -1]}, {"items": ["b", "c", "d"]}, id="list_mixed_indices"
+            ),
+            # Should only delete index 1 once
+            pytest.param(
+                {"items": ["a", "b", "c"]}, {"~items": [1, 1, 1]}, {"items": ["a", "c"]}, id="list_duplicate_indices"
+            ),
+            pytest.param(
+                {"dataloaders": {"train": {"batch_size": 32}, "val": {"batch_size": 16}, "test": {"batch_size": 8}}},
+                {"~dataloaders": ["train", "test"]},
+                {"dataloaders": {"val": {"batch_size": 16}}},
+                id="dict_keys",
+            ),
+            pytest.param(
+                {"model": {"dropout": 0.1, "lr": 0.001}},
+                {"~model": ["dropout"]},
+                {"model": {"lr": 0.001}},
+                id="dict_single_key",
+            ),
+        ],
+    )
+    def test_delete_items(self, base, override, expected):
+        """Test deleting list items by index and dict keys by name."""
+        assert apply_operators(base, override) == expected
+
+    @pytest.mark.parametrize(
+        "base,override,match",
+        [
+            pytest.param({"items": ["a", "b", "c"]}, {"~items": [5]}, INDEX_OUT_OF_RANGE_ERROR, id="out_of_bounds"),
+            pytest.param(
+                {"items": ["a", "b", "c"]}, {"~items": [-10]}, NEGATIVE_INDEX_OUT_OF_RANGE_ERROR, id="negative_out_of_bounds"
+            ),
+            pytest.param({"items": ["a", "b", "c"]}, {"~items": ["a"]}, NON_INTEGER_INDEX_ERROR, id="non_integer_index"),
+            pytest.param({"items": ["a", "b", "c"]}, {"~items": []}, EMPTY_REMOVE_LIST_ERROR, id="empty_list"),
+            pytest.param({"model": {"lr": 0.001}}, {"~model": ["dropout"]}, NONEXISTENT_KEY_ERROR, id="nonexistent_dict_key"),
+            pytest.param({"value": 42}, {"~value": [0]}, NON_COLLECTION_ERROR, id="non_collection"),
+        ],
+    )
+    def test_delete_items_errors(self, base, override, match):
+        """Test that invalid list/dict item deletions raise ConfigMergeError."""
+        with pytest.raises(ConfigMergeError, match=match):
             apply_operators(base, override)
 
     def test_delete_list_items_via_config_update(self):
@@ -738,25 +705,26 @@ class TestConfigMerging:
 
         assert config["dataloaders"] == {"val": {}}
 
-    def test_delete_list_items_batch_vs_individual(self):
+    @pytest.mark.parametrize(
+        "updates",
+        [
+            # Batch deletion - the correct way; removes "a" and "c"
+            pytest.param([{"~plugins": [0, 2]}], id="batch"),
+            # Separate operations evaluate indices against the current state, not the original:
+            # [0] removes "a" -> ["b", "c", "d", "e"], then [1] removes "c"
+            pytest.param([{"~plugins": [0]}, {"~plugins": [1]}], id="sequential"),
+        ],
+    )
+    def test_delete_list_items_batch_vs_individual(self, updates):
         """Test that batch deletion is the only way to delete list items.
 
         Path notation like ~plugins::0 doesn't work for lists - you MUST use
         the batch syntax ~plugins: [0, 2] to delete list items.
         """
-        # Batch deletion - the correct way
-        config1 = Config.load({"plugins": ["a", "b", "c", "d", "e"]})
-        config1.update({"~plugins": [0, 2]})
-        assert config1["plugins"] == ["b", "d", "e"]  # Removed "a" and "c"
-
-        # Batch deletion with multiple operations - indices relative to current state
-        config2 = Config.load({"plugins": ["a", "b", "c", "d", "e"]})
-        config2.update({"~plugins": [0]})  # Removes "a" -> ["b", "c", "d", "e"]
-        config2.update({"~plugins": [1]})  # Removes "c" (index 1 in current list)
-        assert config2["plugins"] == ["b", "d", "e"]
-
-        # This demonstrates that separate batch operations evaluate indices
-        # against the current state, not the original state
+        config = Config.load({"plugins": ["a", "b", "c", "d", "e"]})
+        for update in updates:
+            config.update(update)
+        assert config["plugins"] == ["b", "d", "e"]
 
     def test_merge_lists_extends(self):
         """Test that lists extend by default (composition)."""
@@ -819,28 +787,140 @@ class TestConfigMerging:
 class TestConfigAdvanced:
     """Test advanced Config features."""
 
-    def test_resolve_direct_access(self):
+    def test_resolve_direct_access(self, parsed_config_factory):
         """Test Config resolve() for direct access."""
-        config = {"value": 10, "ref": "@value"}
-        parser = Config.load(config)
+        parser = parsed_config_factory({"value": 10, "ref": "@value"})
         result = parser.resolve("ref")
         assert result == 10
 
-    def test_parse_reset_true(self):
+    @staticmethod
+    def _count_tree_parses(monkeypatch):
+        """Wrap Parser.parse so tests can assert how often the tree is walked."""
+        calls = []
+        original = Parser.parse
+
+        def parse(self, config, id_prefix="", lazy=False):
+            calls.append((id_prefix, config))
+            return original(self, config, id_prefix, lazy)
+
+        monkeypatch.setattr(Parser, "parse", parse)
+        return calls
+
+    def test_parse_reset_true(self, monkeypatch):
         """Test parse with reset=True."""
+        calls = self._count_tree_parses(monkeypatch)
         parser = Config({"value": 10, "expr": "$@value * 2"})
         parser._parse(reset=True)
         assert len(parser._resolver._items) > 0
         parser._parse(reset=True)
         assert len(parser._resolver._items) > 0
+        assert len(calls) == 2  # reset=True always rebuilds
 
-    def test_parse_reset_false(self):
+    def test_parse_reset_false(self, monkeypatch):
         """Test parse with reset=False."""
-        parser = Config({"value": 10})
+        calls = self._count_tree_parses(monkeypatch)
+        parser = Config({"value": 10, "ref": "@value"})
         parser._parse(reset=True)
-        first_resolved = dict(parser._resolver._resolved)
+        first_resolved = parser._resolver._resolved
+        parser._parse(reset=False)
+        assert parser._resolver._resolved is first_resolved
+        assert len(calls) == 1  # unchanged config is not re-walked
+
+    def test_parse_reset_false_after_mutation(self, monkeypatch):
+        """Test parse with reset=False re-walks only the changed subtree."""
+        calls = self._count_tree_parses(monkeypatch)
+        parser = Config({"value": 10, "ref": "@value", "other": {"a": 1, "b": 2}})
+        parser._parse()
+        parser["value"] = 20
         parser._parse(reset=False)
-        assert parser._resolver._resolved == first_resolved
+        assert calls[1:] == [("value", 20)]
+        assert parser.resolve("ref") == 20
+        assert parser.resolve("other") == {"a": 1, "b": 2}
+
+    def test_plain_config_skips_parser(self, monkeypatch):
+        """Test configs without references, expressions or components resolve to cached copies unparsed."""
+        calls = self._count_tree_parses(monkeypatch)
+        data = {"model": {"lr": 0.1, "layers": [1, 2]}, "name": "net@1"}
+        parser = Config(data)
+
+        resolved = parser.resolve("model")
+        assert resolved == {"lr": 0.1, "layers": [1, 2]} and resolved is not data["model"]
+        assert parser.resolve("model") is resolved
+        assert parser.resolve("model::layers::1") == 2
+        assert parser.resolve() == data
+        assert calls == []
+
+        parser["model::lr"] = 0.2  # Still plain
+        assert parser.resolve("model::lr") == 0.2
+        assert calls == []
+
+        parser["scaled"] = "$@model::lr * 10"
+        assert parser.resolve("scaled") == 2.0
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("id", ["missing", "model::layers::01", "model::layers::-1", "model::lr::x"])
+    def test_plain_config_unknown_id(self, id):
+        """Test unknown IDs of a plain config fall back to the resolver's errors and defaults."""
+        parser = Config({"model": {"lr": 0.1, "layers": [1, 2]}})
+        assert parser.resolve(id, default="fallback") == "fallback"
+        with pytest.raises(ConfigKeyError):
+            parser.resolve(id)
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            pytest.param({"model": {"ref": "@modle"}}, id="lazy"),
+            pytest.param({"model": {"lr": 0.1}}, id="plain"),
+        ],
+    )
+    def test_missing_id_error_has_file_location(self, yaml_file_factory, payload):
+        """Test a missing-ID error from a file-backed config points into that file."""
+        path = yaml_file_factory(payload)
+        with pytest.raises(ConfigKeyError) as exc_info:
+            Config.load(path).resolve("modle")
+        location = exc_info.value.source_location
+        assert location is not None and location.filepath == path and location.line >= 1
+
+    def test_incremental_reparse_keeps_unaffected_items(self):
+        """Test set() after resolve rebuilds only changed items and their dependents."""
+        parser = Config(
+            {
+                "lr": 0.1,
+                "scaled": "$@lr * 10",
+                "kept": {"_target_": "collections.Counter"},
+                "model": {"lr": "@lr", "name": "net"},
+            }
+        )
+        kept = parser.resolve("kept")
+        assert parser.resolve("scaled") == 1.0
+
+        parser["lr"] = 0.2
+        assert parser.resolve("scaled") == 2.0
+        assert parser.resolve("model") == {"lr": 0.2, "name": "net"}
+        assert parser.resolve("kept") is kept  # Not re-instantiated
+        assert parser.resolve() == {"lr": 0.2, "scaled": 2.0, "kept": kept, "model": {"lr": 0.2, "name": "net"}}
+
+    def test_incremental_reparse_rebuilds_indirect_readers(self):
+        """Test expressions reading __local_refs without an @ edge are rebuilt after any set()."""
+        parser = Config({"a": 1, "b": "$__local_refs['a'] + 1", "c": "@a", "d": "$[1]"})
+        assert parser.resolve("c") == 1
+        assert parser.resolve("b") == 2
+        d = parser.resolve("d")
+
+        parser["a"] = 5
+        assert parser.resolve("c") == 5
+        assert parser.resolve("b") == 6
+        assert parser.resolve("d") is d  # Unrelated expressions keep their value
+
+    def test_incremental_reparse_new_subtree(self):
+        """Test set() creating intermediate paths and relative references after resolve."""
+        parser = Config({"base": 3})
+        assert parser.resolve("base") == 3
+
+        parser["extra::nested::value"] = "$@::::::base + 1"
+        parser["extra::flag"] = True
+        assert parser.resolve("extra") == {"nested": {"value": 4}, "flag": True}
+        assert parser.get("extra::nested::value") == "$@base + 1"
 
     def test_get_parsed_content_auto_parse(self):
         """Test get_parsed_content auto-parses if not parsed."""
@@ -869,8 +949,6 @@ class TestConfigAdvanced:
         """Test get_parsed_content with default."""
         parser = Config({})
         parser._parse()
-        from sparkwheel import Item
-
         default = Item({"default": True}, id="default")
         result = parser.resolve("missing", default=default)
         assert result == {"default": True}
@@ -884,6 +962,59 @@ class TestConfigAdvanced:
         assert "expr" in parser._resolver._items
         assert "plain" in parser._resolver._items
 
+    def test_parse_creates_items_on_first_use(self):
+        """Test _parse only indexes nodes and the resolver creates Items when they are resolved."""
+        parser = Config({"used": "$@base + 1", "base": 1, "unused": {"_target_": "collections.Counter"}})
+        parser._parse()
+        items = parser._resolver._items
+        assert not any(isinstance(item, Item) for item in items.values())
+
+        assert parser.resolve("used") == 2
+        assert isinstance(items["used"], Item) and isinstance(items["base"], Item)
+        assert not isinstance(items["unused"], Item)
+        assert isinstance(parser._resolver.get_item("unused"), Item)
+
+    def test_parse_records_import_expressions_once(self, monkeypatch):
+        """Test import expressions are found while indexing, not rescanned on each resolution."""
+        parser = Config({"imp": "$import json", "a": 1, "b": "$json.dumps(@a)", "c": "$'import'"})
+        parser._parse()
+        assert list(parser._resolver._imports) == ["imp"]
+
+        monkeypatch.setattr(Expression, "is_import_statement", pytest.fail)
+        assert parser.resolve("b") == "1"
+        assert not isinstance(parser._resolver._items["c"], Item)
+
+    @pytest.mark.parametrize(
+        "node,expected",
+        [
+            pytest.param({"_target_": "dict"}, Component, id="component"),
+            pytest.param(OrderedDict(_target_="dict"), Component, id="component_dict_subclass"),
+            pytest.param("$1 + 1", Expression, id="expression"),
+            pytest.param(UserString("$1 + 1"), Item, id="str_like_is_plain"),
+            pytest.param({"a": 1}, Item, id="dict"),
+            pytest.param([1], Item, id="list"),
+            pytest.param(1.5, Item, id="scalar"),
+        ],
+    )
+    def test_create_item_kind(self, node, expected):
+        """Test nodes are wrapped in the right Item subclass, including container subclasses."""
+        item = Parser(globals={}, metadata=MetadataRegistry()).create_item(node, "x")
+        assert type(item) is expected
+
+    def test_parse_order_and_deep_nesting(self):
+        """Test the parser emits children before parents and handles nesting deeper than the recursion limit."""
+        items = Parser(globals={}, metadata=MetadataRegistry()).parse({"a": {"b": [1, "$2"]}, "c": 3})
+        assert [item.id for item in items] == ["a::b::0", "a::b::1", "a::b", "a", "c", ""]
+        assert all(sys.intern(item.id) is item.id for item in items)
+
+        deep: dict = {}
+        node = deep
+        for _ in range(sys.getrecursionlimit() + 100):
+            node["x"] = {}
+            node = node["x"]
+        items = Parser(globals={}, metadata=MetadataRegistry()).parse(deep)
+        assert items[-1].id == ""
+
 
 class TestConfigEdgeCases:
     """Test edge cases in Config."""
@@ -942,8 +1073,6 @@ class TestConfigEdgeCases:
 
     def test_resolve_with_item_default(self):
         """Test resolve with Item instance as default."""
-        from sparkwheel import Item
-
         parser = Config({"existing": "value"})
 
         item_default = Item({"default_key": "default_value"}, id="default")
@@ -1,16 +1,51 @@
+import tracemalloc
+
 import pytest
 
 from sparkwheel import Config
 from sparkwheel.errors import (
     enable_colors,
     format_available_keys,
+    format_code,
+    format_error,
     format_resolution_chain,
+    format_suggestion,
     format_suggestions,
     get_suggestions,
     levenshtein_distance,
+    suggestions,
 )
 from sparkwheel.errors.context import _format_value_repr
-from sparkwheel.utils.exceptions import ConfigKeyError
+from sparkwheel.errors.formatters import (
+    BLUE,
+    BOLD,
+    GRAY,
+    GREEN,
+    RED,
+    RESET,
+    YELLOW,
+    _supports_color,
+    format_bold,
+    format_context,
+    format_success,
+)
+from sparkwheel.utils.exceptions import BaseError, ConfigKeyError, SourceLocation
+
+# Candidate keys shared by the suggestion tests
+PARAM_KEYS = ("parameters", "param_groups", "learning_rate")
+OPTIMIZER_KEYS = ("optimizer", "optimiser", "optimize")
+FRUIT_KEYS = ("apple", "banana", "cherry")
+MIXED_CASE_KEYS = ("Learning_Rate", "BATCH_SIZE")
+
+
+class _Stream:
+    """Output stream stub reporting a fixed TTY status."""
+
+    def __init__(self, isatty: bool):
+        self._isatty = isatty
+
+    def isatty(self) -> bool:
+        return self._isatty
 
 
 class TestLevenshteinDistance:
@@ -36,20 +71,84 @@ class TestLevenshteinDistance:
         """Test distance with multiple operations."""
         assert levenshtein_distance("kitten", "sitting") == 3
 
+    @pytest.mark.parametrize(
+        "s1,s2,expected",
+        [
+            pytest.param("model::optimizer::lr", "model::optimiser::lr", 1, id="typo"),
+            pytest.param("abcdef", "badcfe", 4, id="swaps"),
+            pytest.param("a" * 70, "a" * 69 + "b", 1, id="longer_than_64"),
+            pytest.param("ab" * 50, "ba" * 50, 2, id="shifted"),
+            pytest.param("ümlaut", "umlaut", 1, id="unicode"),
+        ],
+    )
+    def test_known_distances(self, s1, s2, expected):
+        """Test distances of keys beyond the classic examples, in both argument orders."""
+        assert levenshtein_distance(s1, s2) == levenshtein_distance(s2, s1) == expected
+
     def test_empty_strings(self):
         """Test distance with empty strings."""
         assert levenshtein_distance("", "") == 0
         assert levenshtein_distance("hello", "") == 5
         assert levenshtein_distance("", "world") == 5
 
+    @pytest.mark.parametrize(
+        "s1,s2,expected",
+        [
+            pytest.param("a" * 2_000, "ab" * 5, 1_995, id="long_vs_short"),
+            pytest.param("xy" * 5, "x" * 2_000, 1_995, id="short_vs_long"),
+        ],
+    )
+    def test_long_strings_use_memory_of_shorter(self, s1, s2, expected):
+        """Test memory stays bounded by the shorter string, however long the other one is."""
+        tracemalloc.start()
+        try:
+            assert levenshtein_distance(s1, s2) == expected
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert peak < 4_096
+
+    @pytest.mark.parametrize("max_distance", [0, 1, 2, 3, 10])
+    @pytest.mark.parametrize(
+        "s1,s2",
+        [("kitten", "sitting"), ("hello", ""), ("model::lr", "model::lr"), ("optimizer", "optimiser"), ("ccdbdd", "bbbaccb")],
+    )
+    def test_max_distance_caps_result(self, s1, s2, max_distance):
+        """Test a bound returns the exact distance within it and max_distance + 1 beyond it."""
+        assert levenshtein_distance(s1, s2, max_distance) == min(levenshtein_distance(s1, s2), max_distance + 1)
+
+    @pytest.mark.parametrize(
+        "use_rapidfuzz",
+        [pytest.param(True, marks=pytest.mark.skipif(not suggestions.has_rapidfuzz, reason="rapidfuzz not installed")), False],
+    )
+    def test_backends_agree(self, monkeypatch, use_rapidfuzz):
+        """Test the rapidfuzz and pure-Python implementations give the same distances and caps."""
+        monkeypatch.setattr(suggestions, "has_rapidfuzz", use_rapidfuzz)
+        assert levenshtein_distance("kitten", "sitting") == 3
+        assert levenshtein_distance("", "world") == 5
+        assert levenshtein_distance("kitten", "sitting", max_distance=1) == 2
+        assert levenshtein_distance("a", "a" * 100, max_distance=3) == 4
+
+    def test_max_distance_length_gap_exits_early(self, monkeypatch):
+        """Test strings whose lengths differ by more than the bound are not compared at all."""
+
+        class _Unscanned(str):
+            def __iter__(self):
+                pytest.fail("characters were scanned despite the length gap")
+
+        monkeypatch.setattr(suggestions, "has_rapidfuzz", False)
+        assert levenshtein_distance(_Unscanned("a" * 5), _Unscanned("a" * 5_000), max_distance=10) == 11
+        # Within the bound the characters are scanned
+        with pytest.raises(pytest.fail.Exception):
+            levenshtein_distance(_Unscanned("a" * 5), _Unscanned("a" * 15), max_distance=10)
+
 
 class TestGetSuggestions:
     """Test smart suggestion generation."""
 
     def test_close_match(self):
         """Test finding close matches."""
-        available = ["parameters", "param_groups", "learning_rate"]
-        suggestions = get_suggestions("paramters", available)
+        suggestions = get_suggestions("paramters", PARAM_KEYS)
 
         # Should suggest "parameters" with high similarity
         assert len(suggestions) > 0
@@ -58,8 +157,7 @@ class TestGetSuggestions:
 
     def test_multiple_suggestions(self):
         """Test getting multiple ranked suggestions."""
-        available = ["optimizer", "optimiser", "optimize"]
-        suggestions = get_suggestions("optimzer", available, max_suggestions=3)
+        suggestions = get_suggestions("optimzer", OPTIMIZER_KEYS, max_suggestions=3)
 
         # Should return suggestions sorted by similarity
         assert len(suggestions) <= 3
@@ -69,16 +167,14 @@ class TestGetSuggestions:
 
     def test_no_matches_below_threshold(self):
         """Test that poor matches are filtered out."""
-        available = ["apple", "banana", "cherry"]
-        suggestions = get_suggestions("zebra", available, similarity_threshold=0.6)
+        suggestions = get_suggestions("zebra", FRUIT_KEYS, similarity_threshold=0.6)
 
         # "zebra" is too different from fruit names
         assert len(suggestions) == 0
 
     def test_case_insensitive(self):
         """Test that matching is case-insensitive."""
-        available = ["Learning_Rate", "BATCH_SIZE"]
-        suggestions = get_suggestions("learning_rate", available)
+        suggestions = get_suggestions("learning_rate", MIXED_CASE_KEYS)
 
         assert len(suggestions) > 0
         assert suggestions[0][0] == "Learning_Rate"
@@ -88,6 +184,32 @@ class TestGetSuggestions:
         assert get_suggestions("", ["a", "b"]) == []
         assert get_suggestions("test", []) == []
 
+    def test_repeated_miss_is_ranked_once(self, monkeypatch):
+        """Test identical lookups reuse the ranking but return independent lists."""
+        calls = []
+        distance = suggestions.levenshtein_distance
+        monkeypatch.setattr(suggestions, "levenshtein_distance", lambda *args: calls.append(args) or distance(*args))
+        suggestions._rank_suggestions.cache_clear()
+        first = get_suggestions("paramters", PARAM_KEYS)
+        assert len(calls) == len(PARAM_KEYS)
+        first.clear()
+        assert get_suggestions("paramters", list(PARAM_KEYS)) == [("parameters", 0.9)]
+        assert len(calls) == len(PARAM_KEYS)
+
+        get_suggestions("paramters", PARAM_KEYS, max_suggestions=1)
+        assert len(calls) == 2 * len(PARAM_KEYS)
+
+    def test_length_gap_skips_distance(self, monkeypatch):
+        """Test candidates whose length alone rules them out never reach levenshtein_distance."""
+        calls = []
+        distance = suggestions.levenshtein_distance
+        monkeypatch.setattr(suggestions, "levenshtein_distance", lambda *args: calls.append(args[1]) or distance(*args))
+        suggestions._rank_suggestions.cache_clear()
+
+        available = ("lr", "l", "learning_rate_schedule", "rl")
+        assert get_suggestions("lrr", available) == [("lr", 1.0 - 1 / 3)]
+        assert calls == ["lr", "l", "rl"]
+
 
 class TestFormatSuggestions:
     """Test suggestion formatting."""
@@ -128,23 +250,27 @@ class TestFormatSuggestions:
 class TestFormatAvailableKeys:
     """Test available keys formatting."""
 
-    def test_format_simple_config(self):
-        """Test formatting simple config."""
-        config = {"_target_": "torch.nn.Linear", "in_features": 784, "out_features": 10}
+    @pytest.mark.parametrize(
+        "config,fragments",
+        [
+            pytest.param(
+                {"_target_": "torch.nn.Linear", "in_features": 784, "out_features": 10},
+                ("Available keys:", "_target_", "in_features", "out_features"),
+                id="simple",
+            ),
+            pytest.param({"model": {"layers": 3}, "optimizer": "adam"}, ("model:", "optimizer:"), id="nested"),
+            pytest.param({"model": {}, "optimizer": "adam"}, ("model: {}",), id="empty_dict_value"),
+            pytest.param({"layers": [], "dropout": 0.5}, ("layers: []",), id="empty_list_value"),
+            pytest.param(
+                {"model": {f"param{i}": i for i in range(10)}, "optimizer": "adam"}, ("model:", "keys)"), id="large_dict_value"
+            ),
+            pytest.param({"layers": [1, 2, 3, 4, 5, 6, 7, 8], "dropout": 0.5}, ("layers:", "items)"), id="large_list_value"),
+        ],
+    )
+    def test_format_config(self, config, fragments):
+        """Test each key is listed with a short rendering of its value (large containers summarized)."""
         formatted = format_available_keys(config)
-
-        assert "Available keys:" in formatted
-        assert "_target_" in formatted
-        assert "in_features" in formatted
-        assert "out_features" in formatted
-
-    def test_format_nested_config(self):
-        """Test formatting config with nested values."""
-        config = {"model": {"layers": 3}, "optimizer": "adam"}
-        formatted = format_available_keys(config)
-
-        assert "model:" in formatted
-        assert "optimizer:" in formatted
+        assert all(fragment in formatted for fragment in fragments), formatted
 
     def test_format_empty_config(self):
         """Test formatting empty config."""
@@ -157,38 +283,6 @@ class TestFormatAvailableKeys:
 
         assert "and 15 more" in formatted or "and 14 more" in formatted  # Depends on sorting
 
-    def test_format_with_empty_dict_value(self):
-        """Test formatting config with empty dict value."""
-        config = {"model": {}, "optimizer": "adam"}
-        formatted = format_available_keys(config)
-
-        assert "model: {}" in formatted
-
-    def test_format_with_empty_list_value(self):
-        """Test formatting config with empty list value."""
-        config = {"layers": [], "dropout": 0.5}
-        formatted = format_available_keys(config)
-
-        assert "layers: []" in formatted
-
-    def test_format_with_large_dict_value(self):
-        """Test formatting config with large dict (>3 items)."""
-        config = {"model": {f"param{i}": i for i in range(10)}, "optimizer": "adam"}
-        formatted = format_available_keys(config)
-
-        # Should show "{...} (N keys)" for large dicts
-        assert "model:" in formatted
-        assert "keys)" in formatted
-
-    def test_format_with_large_list_value(self):
-        """Test formatting config with large list (>3 items)."""
-        config = {"layers": [1, 2, 3, 4, 5, 6, 7, 8], "dropout": 0.5}
-        formatted = format_available_keys(config)
-
-        # Should show "[...] (N items)" for large lists
-        assert "layers:" in formatted
-        assert "items)" in formatted
-
     def test_format_with_long_value_truncation(self):
         """Test that very long values are truncated."""
         long_string = "x" * 100
@@ -209,40 +303,36 @@ class TestFormatAvailableKeys:
 class TestFormatValueRepr:
     """Test _format_value_repr function for value formatting."""
 
-    def test_format_empty_dict(self):
-        """Test formatting empty dict."""
-        assert _format_value_repr({}) == "{}"
-
-    def test_format_empty_list(self):
-        """Test formatting empty list."""
-        assert _format_value_repr([]) == "[]"
-
-    def test_format_small_dict(self):
-        """Test formatting small dict (<=3 items)."""
-        result = _format_value_repr({"a": 1, "b": 2, "c": 3})
-        assert "{" in result
-        assert "}" in result
-        assert "a:" in result
-
-    def test_format_large_dict(self):
-        """Test formatting large dict (>3 items)."""
-        large_dict = {f"key{i}": i for i in range(10)}
-        result = _format_value_repr(large_dict)
-        assert "{...}" in result
-        assert "10 keys" in result
-
-    def test_format_small_list(self):
-        """Test formatting small list (<=3 items)."""
-        result = _format_value_repr([1, 2, 3])
-        assert "[" in result
-        assert "]" in result
-
-    def test_format_large_list(self):
-        """Test formatting large list (>3 items)."""
-        large_list = list(range(10))
-        result = _format_value_repr(large_list)
-        assert "[...]" in result
-        assert "10 items" in result
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            pytest.param({}, "{}", id="empty_dict"),
+            pytest.param([], "[]", id="empty_list"),
+            pytest.param("hello", '"hello"', id="string"),
+            pytest.param(42, "42", id="int"),
+            pytest.param(3.14, "3.14", id="float"),
+            pytest.param(True, "True", id="true"),
+            pytest.param(False, "False", id="false"),
+            pytest.param(None, "None", id="none"),
+        ],
+    )
+    def test_format_exact(self, value, expected):
+        """Test formatting empty containers and scalars."""
+        assert _format_value_repr(value) == expected
+
+    @pytest.mark.parametrize(
+        "value,fragments",
+        [
+            pytest.param({"a": 1, "b": 2, "c": 3}, ("{", "}", "a:"), id="small_dict"),
+            pytest.param({f"key{i}": i for i in range(10)}, ("{...}", "10 keys"), id="large_dict"),
+            pytest.param([1, 2, 3], ("[", "]"), id="small_list"),
+            pytest.param(list(range(10)), ("[...]", "10 items"), id="large_list"),
+        ],
+    )
+    def test_format_containers(self, value, fragments):
+        """Test small containers (<=3 items) are shown inline and larger ones summarized."""
+        result = _format_value_repr(value)
+        assert all(fragment in result for fragment in fragments), result
 
     def test_format_long_string_truncation(self):
         """Test that long strings are truncated."""
@@ -251,27 +341,6 @@ class TestFormatValueRepr:
         assert len(result) <= 20
         assert "..." in result
 
-    def test_format_string(self):
-        """Test formatting regular string."""
-        assert _format_value_repr("hello") == '"hello"'
-
-    def test_format_int(self):
-        """Test formatting integer."""
-        assert _format_value_repr(42) == "42"
-
-    def test_format_float(self):
-        """Test formatting float."""
-        assert _format_value_repr(3.14) == "3.14"
-
-    def test_format_bool(self):
-        """Test formatting boolean."""
-        assert _format_value_repr(True) == "True"
-        assert _format_value_repr(False) == "False"
-
-    def test_format_none(self):
-        """Test formatting None."""
-        assert _format_value_repr(None) == "None"
-
     def test_format_custom_object(self):
         """Test formatting custom object (should show type name)."""
 
@@ -357,104 +426,47 @@ class TestColorFormatting:
 
     def test_colors_disabled_in_tests(self):
         """Test that colors can be disabled."""
-        from sparkwheel.errors.formatters import format_error
-
         enable_colors(False)
-        formatted = format_error("error message")
-
-        # Should not contain ANSI codes when disabled
-        assert "\033[" not in formatted
-        assert formatted == "error message"
+        assert format_error("error message") == "error message"
 
     def test_colors_enabled(self):
         """Test that colors work when enabled."""
-        from sparkwheel.errors.formatters import format_error
-
         enable_colors(True)
-        formatted = format_error("error message")
-
-        # Should contain ANSI codes when enabled
-        assert "\033[" in formatted
-        assert "error message" in formatted
-
-    def test_format_suggestion(self):
-        """Test format_suggestion function."""
-        from sparkwheel.errors.formatters import format_suggestion
-
-        enable_colors(True)
-        result = format_suggestion("suggestion text")
-        assert "suggestion text" in result
-        assert "\033[" in result  # Contains ANSI codes
-
-        enable_colors(False)
-        result = format_suggestion("suggestion text")
-        assert result == "suggestion text"
-
-    def test_format_success(self):
-        """Test format_success function."""
-        from sparkwheel.errors.formatters import format_success
-
-        enable_colors(True)
-        result = format_success("success text")
-        assert "success text" in result
-        assert "\033[" in result  # Contains ANSI codes
-
-        enable_colors(False)
-        result = format_success("success text")
-        assert result == "success text"
-
-    def test_format_code(self):
-        """Test format_code function."""
-        from sparkwheel.errors.formatters import format_code
-
+        assert format_error("error message") == f"{RED}error message{RESET}"
+
+    @pytest.mark.parametrize(
+        "formatter,code",
+        [
+            pytest.param(format_suggestion, YELLOW, id="suggestion"),
+            pytest.param(format_success, GREEN, id="success"),
+            pytest.param(format_code, BLUE, id="code"),
+            pytest.param(format_context, GRAY, id="context"),
+            pytest.param(format_bold, BOLD, id="bold"),
+        ],
+    )
+    def test_formatter(self, formatter, code):
+        """Test each formatter wraps text in its ANSI code only while colors are enabled."""
         enable_colors(True)
-        result = format_code("code text")
-        assert "code text" in result
-        assert "\033[" in result  # Contains ANSI codes
+        assert formatter("some text") == f"{code}some text{RESET}"
 
         enable_colors(False)
-        result = format_code("code text")
-        assert result == "code text"
-
-    def test_format_context(self):
-        """Test format_context function."""
-        from sparkwheel.errors.formatters import format_context
-
-        enable_colors(True)
-        result = format_context("context text")
-        assert "context text" in result
-        assert "\033[" in result  # Contains ANSI codes
-
-        enable_colors(False)
-        result = format_context("context text")
-        assert result == "context text"
-
-    def test_format_bold(self):
-        """Test format_bold function."""
-        from sparkwheel.errors.formatters import format_bold
-
-        enable_colors(True)
-        result = format_bold("bold text")
-        assert "bold text" in result
-        assert "\033[" in result  # Contains ANSI codes
-
-        enable_colors(False)
-        result = format_bold("bold text")
-        assert result == "bold text"
-
-    def test_supports_color_with_no_color_env(self, monkeypatch):
-        """Test that NO_COLOR environment variable disables colors."""
-        from sparkwheel.errors.formatters import _supports_color
-
-        monkeypatch.setenv("NO_COLOR", "1")
-        assert _supports_color() is False
-
-    def test_supports_color_with_sparkwheel_no_color_env(self, monkeypatch):
-        """Test that SPARKWHEEL_NO_COLOR environment variable disables colors."""
-        from sparkwheel.errors.formatters import _supports_color
-
-        monkeypatch.setenv("SPARKWHEEL_NO_COLOR", "1")
-        assert _supports_color() is False
+        assert formatter("some text") == "some text"
+
+    @pytest.mark.parametrize(
+        "env,stream,expected",
+        [
+            pytest.param({"NO_COLOR": "1"}, _Stream(isatty=True), False, id="no_color"),
+            pytest.param({"SPARKWHEEL_NO_COLOR": "1"}, _Stream(isatty=True), False, id="sparkwheel_no_color"),
+            pytest.param({"FORCE_COLOR": "1"}, _Stream(isatty=False), True, id="force_color_without_tty"),
+            pytest.param({"NO_COLOR": "1", "FORCE_COLOR": "1"}, _Stream(isatty=True), False, id="no_color_beats_force"),
+            pytest.param({}, object(), False, id="no_isatty"),
+            pytest.param({}, _Stream(isatty=False), False, id="isatty_false"),
+            pytest.param({}, _Stream(isatty=True), True, id="tty"),
+        ],
+    )
+    def test_supports_color(self, env, stream, expected):
+        """Test color detection from the environment and the output stream."""
+        assert _supports_color(stream=stream, env=env) is expected
 
     def test_get_colors_enabled_lazy_init(self):
         """Test that _get_colors_enabled initializes colors if needed."""
@@ -468,93 +480,6 @@ class TestColorFormatting:
         assert isinstance(result, bool)
         assert formatters._COLORS_ENABLED is not None
 
-    def test_supports_color_force_color(self, monkeypatch):
-        """Test FORCE_COLOR enables colors even without TTY."""
-        import sys
-
-        from sparkwheel.errors.formatters import _supports_color
-
-        # Clear NO_COLOR and set FORCE_COLOR
-        monkeypatch.delenv("NO_COLOR", raising=False)
-        monkeypatch.delenv("SPARKWHEEL_NO_COLOR", raising=False)
-        monkeypatch.setenv("FORCE_COLOR", "1")
-
-        # Mock stdout without isatty
-        class MockStdout:
-            def isatty(self):
-                return False
-
-        original_stdout = sys.stdout
-        try:
-            sys.stdout = MockStdout()
-            assert _supports_color() is True
-        finally:
-            sys.stdout = original_stdout
-
-    def test_supports_color_no_color_overrides_force_color(self, monkeypatch):
-        """Test NO_COLOR takes precedence over FORCE_COLOR."""
-        import sys
-
-        from sparkwheel.errors.formatters import _supports_color
-
-        # Set both NO_COLOR and FORCE_COLOR - NO_COLOR should win
-        monkeypatch.setenv("NO_COLOR", "1")
-        monkeypatch.setenv("FORCE_COLOR", "1")
-
-        # Mock stdout with TTY
-        class MockStdout:
-            def isatty(self):
-                return True
-
-        original_stdout = sys.stdout
-        try:
-            sys.stdout = MockStdout()
-            # NO_COLOR should override both FORCE_COLOR and TTY
-            assert _supports_color() is False
-        finally:
-            sys.stdout = original_stdout
-
-    def test_supports_color_no_isatty(self, monkeypatch):
-        """Test color detection when stdout has no isatty method."""
-        import sys
-
-        from sparkwheel.errors.formatters import _supports_color
-
-        # Disable colors to override any CI environment settings
-        monkeypatch.setenv("NO_COLOR", "1")
-
-        # Mock stdout without isatty
-        class MockStdout:
-            pass
-
-        original_stdout = sys.stdout
-        try:
-            sys.stdout = MockStdout()
-            assert _supports_color() is False
-        finally:
-            sys.stdout = original_stdout
-
-    def test_supports_color_isatty_false(self, monkeypatch):
-        """Test color detection when isatty returns False."""
-        import sys
-
-        from sparkwheel.errors.formatters import _supports_color
-
-        # Disable colors to override any CI environment settings
-        monkeypatch.setenv("NO_COLOR", "1")
-
-        # Mock stdout with isatty that returns False
-        class MockStdout:
-            def isatty(self):
-                return False
-
-        original_stdout = sys.stdout
-        try:
-            sys.stdout = MockStdout()
-            assert _supports_color() is False
-        finally:
-            sys.stdout = original_stdout
-
 
 class TestConfigKeyErrorEnhanced:
     """Test enhanced ConfigKeyError with suggestions."""
@@ -589,12 +514,9 @@ class TestConfigKeyErrorEnhanced:
         assert "lr:" in error_str
         assert "epochs:" in error_str
 
-    def test_error_integration_with_parser(self, tmp_path):
+    def test_error_integration_with_parser(self):
         """Test that Config raises enhanced errors."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("model:\n  learning_rate: 0.001\n  batch_size: 32\nvalue: 10\nref: '@valu'")
-
-        parser = Config.load(str(config_file))
+        parser = Config.loads("model:\n  learning_rate: 0.001\n  batch_size: 32\nvalue: 10\nref: '@valu'")
 
         # Try to access reference with typo - should get suggestion
         with pytest.raises(ConfigKeyError) as exc_info:
@@ -608,27 +530,24 @@ class TestConfigKeyErrorEnhanced:
 class TestErrorMessagesIntegration:
     """Integration tests for error messages in real scenarios."""
 
-    def test_typo_in_reference(self, tmp_path):
+    def test_typo_in_reference(self):
         """Test error message when reference has typo."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("value: 10\nref: '@vlue'")
-
-        parser = Config.load(str(config_file))
+        parser = Config.loads("value: 10\nmodel:\n  lr: '@vlue'")
 
         with pytest.raises(ConfigKeyError) as exc_info:
-            parser.resolve("ref")
+            parser.resolve("model")
 
         error_msg = str(exc_info.value)
         # Should suggest "value"
         assert "value" in error_msg
         assert "💡" in error_msg
+        # Only mappings and sequences carry locations, so the error points at "model"
+        assert exc_info.value.source_location == SourceLocation("<string>", 3, 3, "model")
+        assert error_msg.startswith("[<string>:3 @ model]")
 
-    def test_missing_nested_key(self, tmp_path):
+    def test_missing_nested_key(self):
         """Test error for missing nested key."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("model:\n  lr: 0.001")
-
-        parser = Config.load(str(config_file))
+        parser = Config.loads("model:\n  lr: 0.001")
 
         with pytest.raises(ConfigKeyError) as exc_info:
             _ = parser.resolve("model::optimizer")
@@ -636,6 +555,7 @@ class TestErrorMessagesIntegration:
         error_msg = str(exc_info.value)
         # Should show available keys in model
         assert "lr" in error_msg or "💡" in error_msg
+        assert exc_info.value.source_location == SourceLocation("<string>", 2, 3, "model")
 
 
 class TestExceptionEdgeCases:
@@ -643,25 +563,19 @@ class TestExceptionEdgeCases:
 
     def test_source_location_without_id(self):
         """Test SourceLocation string formatting without ID."""
-        from sparkwheel.utils.exceptions import SourceLocation
-
         loc = SourceLocation(filepath="test.yaml", line=10)
         assert str(loc) == "test.yaml:10"
 
     def test_base_error_without_source_location_id(self):
         """Test BaseError formatting when source_location has no ID."""
-        from sparkwheel.utils.exceptions import BaseError, SourceLocation
-
         loc = SourceLocation(filepath="test.yaml", line=5)
         error = BaseError("Test error", source_location=loc)
         msg = str(error)
         assert "[test.yaml:5]" in msg
         assert "Test error" in msg
 
-    def test_base_error_snippet_file_read_error(self, tmp_path):
+    def test_base_error_snippet_file_read_error(self):
         """Test BaseError snippet handling when file can't be read."""
-        from sparkwheel.utils.exceptions import BaseError, SourceLocation
-
         # Create a source location pointing to non-existent file
         loc = SourceLocation(filepath="/nonexistent/file.yaml", line=5)
         error = BaseError("Test error", source_location=loc)
@@ -671,8 +585,6 @@ class TestExceptionEdgeCases:
 
     def test_config_key_error_no_suggestions(self):
         """Test ConfigKeyError when no suggestions can be generated."""
-        from sparkwheel.utils.exceptions import ConfigKeyError
-
         # No available keys
         error = ConfigKeyError(
             "Key not found",
@@ -684,8 +596,6 @@ class TestExceptionEdgeCases:
 
     def test_config_key_error_with_many_keys(self):
         """Test ConfigKeyError when too many keys to display."""
-        from sparkwheel.utils.exceptions import ConfigKeyError
-
         # More than 10 keys - should not display all
         many_keys = [f"key{i}" for i in range(15)]
         config = {k: "value" for k in many_keys}
@@ -700,8 +610,6 @@ class TestExceptionEdgeCases:
 
     def test_config_key_error_with_suggestions_and_keys(self):
         """Test ConfigKeyError with both suggestions and available keys."""
-        from sparkwheel.utils.exceptions import ConfigKeyError
-
         error = ConfigKeyError(
             "Key not found",
             missing_key="vlue",
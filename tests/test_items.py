@@ -2,8 +2,9 @@
 
 import pytest
 
+from sparkwheel import items
 from sparkwheel.items import Component, Expression, Item
-from sparkwheel.utils.exceptions import EvaluationError, InstantiationError, ModuleNotFoundError
+from sparkwheel.utils.exceptions import EvaluationError, InstantiationError, ModuleNotFoundError, SourceLocation
 
 
 class TestItem:
@@ -16,6 +17,13 @@ class TestItem:
         assert item.get_id() == "test_id"
         assert item.get_config() == {"key": "value"}
 
+    @pytest.mark.parametrize("item", [Item(config=1, id="a"), Component(config={"_target_": "dict"}, id="b")])
+    def test_items_have_no_instance_dict(self, item):
+        """Test Item and Component store their attributes in slots."""
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(AttributeError):
+            item.undeclared = True
+
     def test_update_config(self):
         """Test updating item config."""
         item = Item(config={"old": "value"}, id="test")
@@ -70,6 +78,14 @@ class TestComponent:
         assert "_target_" not in args
         assert "_disabled_" not in args
 
+    def test_resolve_args_returns_fresh_dict(self):
+        """Test resolve_args builds a new dict per call so instantiate() kwargs cannot leak."""
+        component = Component(config={"_target_": "collections.Counter", "iterable": [1]})
+        args = component.resolve_args()
+        args["extra"] = 1
+
+        assert component.resolve_args() == {"iterable": [1]}
+
     def test_resolve_args_non_mapping(self):
         """Test resolve_args with non-mapping config raises TypeError."""
         component = Component(config="not a dict")
@@ -100,6 +116,14 @@ class TestComponent:
         component = Component(config={"_disabled_": "false"})
         assert component.is_disabled() is False
 
+    def test_is_disabled_recomputed_after_update_config(self):
+        """Test the cached disabled flag is dropped when the config is replaced."""
+        component = Component(config={"_target_": "builtins.dict", "_disabled_": True})
+        assert component.is_disabled() is True
+
+        component.update_config({"_target_": "builtins.dict", "_disabled_": False})
+        assert component.is_disabled() is False
+
     def test_instantiate_basic(self):
         """Test basic instantiation."""
         # Use dict which accepts keyword arguments
@@ -295,6 +319,19 @@ class TestExpression:
         assert result == json
         assert "json" in expr.globals
 
+    def test_evaluate_import_reuses_cached_module(self, monkeypatch):
+        """Test a repeated import statement binds the cached object without importing again."""
+        items._import_single.cache_clear()
+        Expression(config="$import json as js", id="first").evaluate()
+
+        monkeypatch.setattr("sparkwheel.items.optional_import", pytest.fail)
+        expr = Expression(config="$import json as js", id="second")
+
+        import json
+
+        assert expr.evaluate() is json
+        assert expr.globals["js"] is json
+
     def test_evaluate_multiple_imports_warning(self):
         """Test warning for multiple imports in one statement."""
         expr = Expression(config="$from os import path, environ", id="test")
@@ -336,6 +373,24 @@ class TestExpression:
 
         assert result == 3
 
+    def test_evaluate_reuses_compiled_code(self):
+        """Test repeated evaluation reuses the code object compiled on first use."""
+        expr = Expression(config="$x * 2", id="test")
+        assert expr.evaluate(globals={"x": 1}) == 2
+        code = expr._code
+
+        assert expr.evaluate(globals={"x": 3}) == 6
+        assert expr._code is code
+
+    def test_update_config_recompiles(self):
+        """Test update_config drops the compiled code so the new body is evaluated."""
+        expr = Expression(config="$1 + 1", id="test")
+        assert expr.evaluate() == 2
+
+        expr.update_config("$2 + 2")
+        assert expr._code is None
+        assert expr.evaluate() == 4
+
 
 class TestExpressionDebugMode:
     """Test Expression debug mode."""
@@ -370,8 +425,6 @@ class TestItemWithSourceLocation:
 
     def test_item_with_source_location(self):
         """Test creating item with source location."""
-        from sparkwheel.utils.exceptions import SourceLocation
-
         location = SourceLocation(filepath="/tmp/config.yaml", line=10, column=5, id="model::lr")
         item = Item(config={"lr": 0.001}, id="model::lr", source_location=location)
 
@@ -381,8 +434,6 @@ class TestItemWithSourceLocation:
 
     def test_component_error_includes_source_location(self):
         """Test that component errors include source location."""
-        from sparkwheel.utils.exceptions import SourceLocation
-
         location = SourceLocation(filepath="/tmp/config.yaml", line=15, column=2, id="model")
         config = {"_target_": "nonexistent.Module"}
         component = Component(config=config, id="model", source_location=location)
@@ -395,8 +446,6 @@ class TestItemWithSourceLocation:
 
     def test_expression_error_includes_source_location(self):
         """Test that expression errors include source location."""
-        from sparkwheel.utils.exceptions import SourceLocation
-
         location = SourceLocation(filepath="/tmp/config.yaml", line=20, column=2, id="calc")
         expr = Expression(config="$undefined_var", id="calc", source_location=location)
 
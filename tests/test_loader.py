@@ -1,22 +1,35 @@
 """Tests for the YAML loader module."""
 
+import io
+import json
+import os
+import stat
+from pathlib import Path
+
 import pytest
 
+from sparkwheel import loader as loader_module
 from sparkwheel.loader import Loader
 from sparkwheel.metadata import MetadataRegistry
 from sparkwheel.utils.exceptions import SourceLocation
 
 
+@pytest.fixture
+def yaml_stream():
+    """Return a factory wrapping YAML text in an in-memory binary stream (no filesystem access)."""
+    return lambda text: io.BytesIO(text.encode())
+
+
 class TestLoaderBasic:
     """Test basic Loader functionality."""
 
-    def test_load_file_basic(self, tmp_path):
-        """Test loading a basic YAML file."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("key: value\nnumber: 42")
+    @pytest.mark.parametrize("ext", [".yaml", ".yml"])
+    def test_load_file_basic(self, yaml_file_factory, ext):
+        """Test loading a basic .yaml or .yml file."""
+        config_file = yaml_file_factory({"key": "value", "number": 42}, ext=ext)
 
         loader = Loader()
-        config, metadata = loader.load_file(str(config_file))
+        config, metadata = loader.load_file(config_file)
 
         assert config == {"key": "value", "number": 42}
         assert isinstance(metadata, MetadataRegistry)
@@ -37,14 +50,28 @@ class TestLoaderBasic:
         assert config == {}
         assert isinstance(metadata, MetadataRegistry)
 
-    def test_load_file_non_yaml_extension(self, tmp_path):
+    def test_load_file_non_yaml_extension(self, yaml_file_factory):
         """Test loading non-YAML file raises ValueError."""
-        config_file = tmp_path / "config.txt"
-        config_file.write_text("key: value")
+        config_file = yaml_file_factory({"key": "value"}, ext=".txt")
 
         loader = Loader()
         with pytest.raises(ValueError, match="must be a YAML file"):
-            loader.load_file(str(config_file))
+            loader.load_file(config_file)
+
+    @pytest.mark.parametrize(
+        "use_orjson",
+        [pytest.param(True, marks=pytest.mark.skipif(not loader_module.has_orjson, reason="orjson not installed")), False],
+    )
+    def test_load_file_json(self, tmp_path, monkeypatch, use_orjson):
+        """Test loading a .json file with orjson or the stdlib fallback."""
+        monkeypatch.setattr(loader_module, "has_orjson", use_orjson)
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"k": "v", "model": {"lr": 0.001, "layers": [1, 2]}}))
+
+        config, metadata = Loader().load_file(config_file)
+
+        assert config == {"k": "v", "model": {"lr": 0.001, "layers": [1, 2]}}
+        assert metadata.get("").filepath == str(config_file.resolve())
 
     def test_load_file_with_path_traversal(self, tmp_path):
         """Test loading file with path traversal shows warning."""
@@ -60,50 +87,167 @@ class TestLoaderBasic:
 
         assert config == {"key": "value"}
 
-    def test_load_file_with_yml_extension(self, tmp_path):
-        """Test loading .yml file works."""
-        config_file = tmp_path / "config.yml"
-        config_file.write_text("key: value")
+    def test_load_string(self):
+        """Test loading YAML from an in-memory string."""
+        loader = Loader()
+        config, metadata = loader.load_string("model:\n  lr: 0.001")
 
+        assert config == {"model": {"lr": 0.001}}
+        assert metadata.get("model").filepath == "<string>"
+
+    def test_load_stream(self, yaml_stream):
+        """Test loading YAML from a binary stream, naming locations after the stream."""
         loader = Loader()
-        config, metadata = loader.load_file(str(config_file))
+        config, metadata = loader.load_stream(yaml_stream("model:\n  lr: 0.001"))
+        assert config == {"model": {"lr": 0.001}}
+        assert metadata.get("model").filepath == "<stream>"
+        assert metadata.get("model").line == 2
+
+        named = io.StringIO("key: value")
+        named.name = "named.yaml"
+        assert loader.load_stream(named)[1].get("").filepath == "named.yaml"
+
+    @pytest.mark.filesystem
+    def test_load_file_cache(self, tmp_path, monkeypatch):
+        """Test repeated loads reuse the parse but return independent copies until the file changes."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("model:\n  lr: 0.001")
+        loader = Loader()
+        first, first_metadata = loader.load_file(config_file)
 
-        assert config == {"key": "value"}
+        with monkeypatch.context() as m:
+            m.setattr(Loader, "_load_yaml_with_metadata", pytest.fail)
+            second, second_metadata = loader.load_file(config_file)
+        assert second == first and second["model"] is not first["model"]
+        assert second_metadata is not first_metadata and len(second_metadata) == len(first_metadata)
+
+        second["model"]["lr"] = 1.0
+        config_file.write_text("model:\n  lr: 0.01\n  extra: 1")
+        assert loader.load_file(config_file)[0] == {"model": {"lr": 0.01, "extra": 1}}
+        assert first == {"model": {"lr": 0.001}}
+
+        Loader.clear_cache()
+        assert Loader._load_file_cached.cache_info().currsize == 0
+
+    @pytest.mark.filesystem
+    def test_load_file_cache_duplicate_keys(self, tmp_path, monkeypatch):
+        """Test cached loads still warn about duplicate keys and honour strict mode turned on later."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("lr: 0.1\nlr: 0.2")
+        for _ in range(2):
+            with pytest.warns(UserWarning, match="Duplicate key: `lr`"):
+                assert Loader().load_file(config_file)[0] == {"lr": 0.2}
+
+        monkeypatch.setenv("SPARKWHEEL_STRICT_KEYS", "1")
+        with pytest.raises(ValueError, match="Duplicate key"):
+            Loader().load_file(config_file)
+
+    @pytest.mark.filesystem
+    def test_load_file_cache_same_size_rewrite(self, tmp_path):
+        """Test a same-size rewrite is seen even when the modification time looks unchanged."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("lr: 0.1")
+        original = config_file.stat()
+        assert Loader().load_file(config_file)[0] == {"lr": 0.1}
+
+        # Simulate a coarse mtime: same size, same mtime, rewritten in place
+        config_file.write_text("lr: 0.2")
+        os.utime(config_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+        assert Loader().load_file(config_file)[0] == {"lr": 0.2}
+
+        # Replaced by a new file with the same size and mtime
+        replacement = tmp_path / "replacement.yaml"
+        replacement.write_text("lr: 0.3")
+        os.utime(replacement, ns=(original.st_atime_ns, original.st_mtime_ns))
+        os.replace(replacement, config_file)
+        assert Loader().load_file(config_file)[0] == {"lr": 0.3}
+
+    @pytest.mark.filesystem
+    def test_load_file_disk_cache(self, tmp_path, monkeypatch):
+        """Test SPARKWHEEL_CACHE=1 persists parses across processes, keyed by file content."""
+        monkeypatch.setenv("SPARKWHEEL_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("model:\n  lr: 0.001")
+        first, _ = Loader().load_file(config_file)
+        assert len(list((tmp_path / "cache" / "sparkwheel").glob("*.pkl"))) == 1
+
+        Loader.clear_cache()  # A fresh process only has the disk cache
+        with monkeypatch.context() as m:
+            m.setattr(Loader, "_load_yaml_with_metadata", pytest.fail)
+            config, metadata = Loader().load_file(config_file)
+        assert config == first
+        assert metadata.get("model").line == 2
+
+        config_file.write_text("model:\n  lr: 0.01")
+        Loader.clear_cache()
+        assert Loader().load_file(config_file)[0] == {"model": {"lr": 0.01}}
+        assert len(list((tmp_path / "cache" / "sparkwheel").glob("*.pkl"))) == 2
+
+    @pytest.mark.filesystem
+    def test_load_file_disk_cache_is_private(self, tmp_path, monkeypatch):
+        """Test the disk cache directory is created private and corrupt entries are reparsed."""
+        monkeypatch.setenv("SPARKWHEEL_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("model:\n  lr: 0.001")
+        Loader().load_file(config_file)
+        cache_dir = tmp_path / "cache" / "sparkwheel"
+        if hasattr(os, "getuid"):
+            assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+
+        (entry,) = cache_dir.glob("*.pkl")
+        entry.write_bytes(b"not a pickle")
+        Loader.clear_cache()
+        assert Loader().load_file(config_file)[0] == {"model": {"lr": 0.001}}
+
+    @pytest.mark.filesystem
+    @pytest.mark.skipif(not hasattr(os, "getuid"), reason="POSIX permissions only")
+    def test_load_file_disk_cache_skips_shared_dir(self, tmp_path, monkeypatch):
+        """Test a cache directory open to other users is never read from or written to."""
+        monkeypatch.setenv("SPARKWHEEL_CACHE", "1")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        cache_dir = tmp_path / "cache" / "sparkwheel"
+        cache_dir.mkdir(parents=True)
+        cache_dir.chmod(0o777)
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("model:\n  lr: 0.001")
+
+        with pytest.warns(UserWarning, match="Ignoring SPARKWHEEL_CACHE"):
+            assert Loader().load_file(config_file)[0] == {"model": {"lr": 0.001}}
+        assert not list(cache_dir.iterdir())
 
 
 class TestLoaderMetadataTracking:
     """Test metadata tracking during YAML loading."""
 
-    def test_metadata_tracks_source_location(self, tmp_path):
+    def test_metadata_tracks_source_location(self, yaml_file_factory):
         """Test that source locations are tracked."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("model:\n  lr: 0.001")
+        config_file = yaml_file_factory({"model": {"lr": 0.001}})
 
         loader = Loader()
-        config, metadata = loader.load_file(str(config_file))
+        config, metadata = loader.load_file(config_file)
 
         # Check that metadata was registered for top-level keys
         location = metadata.get("")
         assert location is not None
-        assert location.filepath == str(config_file.resolve())
+        assert location.filepath == str(Path(config_file).resolve())
 
-    def test_metadata_with_nested_config(self, tmp_path):
+    def test_metadata_with_nested_config(self, yaml_stream):
         """Test metadata tracking for nested config."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("model:\n  optimizer:\n    lr: 0.001")
+        stream = yaml_stream("model:\n  optimizer:\n    lr: 0.001")
 
         loader = Loader()
-        config, metadata = loader.load_file(str(config_file))
+        config, metadata = loader.load_stream(stream)
 
         assert config == {"model": {"optimizer": {"lr": 0.001}}}
 
-    def test_metadata_with_list_config(self, tmp_path):
+    def test_metadata_with_list_config(self, yaml_stream):
         """Test metadata tracking for list config."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("items:\n  - item1\n  - item2\n  - item3")
+        stream = yaml_stream("items:\n  - item1\n  - item2\n  - item3")
 
         loader = Loader()
-        config, metadata = loader.load_file(str(config_file))
+        config, metadata = loader.load_stream(stream)
 
         assert config == {"items": ["item1", "item2", "item3"]}
         # Metadata should be tracked for the list
@@ -114,16 +258,13 @@ class TestLoaderMetadataTracking:
 class TestLoaderMultipleFiles:
     """Test loading multiple YAML files."""
 
-    def test_load_files_basic(self, tmp_path):
+    def test_load_files_basic(self, yaml_file_factory):
         """Test loading multiple files."""
-        file1 = tmp_path / "config1.yaml"
-        file1.write_text("key1: value1\nshared: from_file1")
-
-        file2 = tmp_path / "config2.yaml"
-        file2.write_text("key2: value2\nshared: from_file2")
+        file1 = yaml_file_factory({"key1": "value1", "shared": "from_file1"})
+        file2 = yaml_file_factory({"key2": "value2", "shared": "from_file2"})
 
         loader = Loader()
-        config, metadata = loader.load_files([str(file1), str(file2)])
+        config, metadata = loader.load_files([file1, file2])
 
         # Later files should override earlier files
         assert config["key1"] == "value1"
@@ -138,26 +279,22 @@ class TestLoaderMultipleFiles:
         assert config == {}
         assert isinstance(metadata, MetadataRegistry)
 
-    def test_load_files_single_file(self, tmp_path):
+    def test_load_files_single_file(self, yaml_file_factory):
         """Test loading single file via load_files."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("key: value")
+        config_file = yaml_file_factory({"key": "value"})
 
         loader = Loader()
-        config, metadata = loader.load_files([str(config_file)])
+        config, metadata = loader.load_files([config_file])
 
         assert config == {"key": "value"}
 
-    def test_load_files_metadata_merged(self, tmp_path):
+    def test_load_files_metadata_merged(self, yaml_file_factory):
         """Test that metadata is merged from multiple files."""
-        file1 = tmp_path / "config1.yaml"
-        file1.write_text("key1: value1")
-
-        file2 = tmp_path / "config2.yaml"
-        file2.write_text("key2: value2")
+        file1 = yaml_file_factory({"key1": "value1"})
+        file2 = yaml_file_factory({"key2": "value2"})
 
         loader = Loader()
-        config, metadata = loader.load_files([str(file1), str(file2)])
+        config, metadata = loader.load_files([file1, file2])
 
         # Both files should have metadata tracked
         assert metadata.get("") is not None
@@ -166,27 +303,25 @@ class TestLoaderMultipleFiles:
 class TestLoaderEdgeCases:
     """Test edge cases in loader."""
 
-    def test_load_empty_yaml_file(self, tmp_path):
+    def test_load_empty_yaml_file(self, yaml_stream):
         """Test loading empty YAML file."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("")
+        stream = yaml_stream("")
 
         loader = Loader()
-        config, metadata = loader.load_file(str(config_file))
+        config, metadata = loader.load_stream(stream)
 
         assert config == {}
 
-    def test_load_yaml_with_null(self, tmp_path):
+    def test_load_yaml_with_null(self, yaml_stream):
         """Test loading YAML file with null value."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("key: null")
+        stream = yaml_stream("key: null")
 
         loader = Loader()
-        config, metadata = loader.load_file(str(config_file))
+        config, metadata = loader.load_stream(stream)
 
         assert config == {"key": None}
 
-    def test_load_yaml_with_complex_nested_structure(self, tmp_path):
+    def test_load_yaml_with_complex_nested_structure(self, yaml_stream):
         """Test loading complex nested structure."""
         yaml_content = """
 model:
@@ -201,35 +336,32 @@ model:
     type: adam
     lr: 0.001
 """
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text(yaml_content)
+        stream = yaml_stream(yaml_content)
 
         loader = Loader()
-        config, metadata = loader.load_file(str(config_file))
+        config, metadata = loader.load_stream(stream)
 
         assert config["model"]["layers"][0]["name"] == "conv1"
         assert config["model"]["layers"][1]["params"]["filters"] == 64
         assert config["model"]["optimizer"]["lr"] == 0.001
 
-    def test_strip_metadata_from_nested_lists(self, tmp_path):
+    def test_strip_metadata_from_nested_lists(self, yaml_stream):
         """Test that metadata is stripped from nested lists."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("items:\n  - [1, 2, 3]\n  - [4, 5, 6]")
+        stream = yaml_stream("items:\n  - [1, 2, 3]\n  - [4, 5, 6]")
 
         loader = Loader()
-        config, metadata = loader.load_file(str(config_file))
+        config, metadata = loader.load_stream(stream)
 
         assert config == {"items": [[1, 2, 3], [4, 5, 6]]}
         # Ensure no __sparkwheel_metadata__ keys in the config
         assert "__sparkwheel_metadata__" not in str(config)
 
-    def test_strip_metadata_from_dicts_in_lists(self, tmp_path):
+    def test_strip_metadata_from_dicts_in_lists(self, yaml_stream):
         """Test stripping metadata from dicts inside lists."""
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("items:\n  - key: value1\n  - key: value2")
+        stream = yaml_stream("items:\n  - key: value1\n  - key: value2")
 
         loader = Loader()
-        config, metadata = loader.load_file(str(config_file))
+        config, metadata = loader.load_stream(stream)
 
         assert config == {"items": [{"key": "value1"}, {"key": "value2"}]}
         # Ensure no __sparkwheel_metadata__ keys
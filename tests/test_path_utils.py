@@ -1,6 +1,7 @@
 """Tests for path utility functions."""
 
 from sparkwheel.path_patterns import PathPatterns, find_references
+from sparkwheel.path_utils import scan_references, split_id, split_id_parts
 
 
 class TestPathPatterns:
@@ -28,3 +29,41 @@ class TestPathPatterns:
         """Test find_references returns empty for plain text."""
         refs = find_references("just plain text")
         assert refs == []
+
+
+class TestScanReferences:
+    """Test scan_references."""
+
+    def test_counts_repeated_references(self):
+        """Test each reference is counted once per occurrence."""
+        assert scan_references("$@x + @x * @model::lr") == {"x": 2, "model::lr": 1}
+
+    def test_ignores_plain_text(self):
+        """Test non-expression, non-reference strings are not scanned."""
+        assert scan_references("email@example.com") == {}
+
+    def test_cached_result_is_not_shared(self):
+        """Test mutating a result does not leak into later calls for the same string."""
+        first = scan_references("$@a + @b")
+        first["a"] = 99
+        assert scan_references("$@a + @b") == {"a": 1, "b": 1}
+
+
+class TestSplitId:
+    """Test split_id."""
+
+    def test_split_nested_id(self):
+        """Test IDs split into a list of parts on ::."""
+        assert split_id("model::optimizer::lr") == ["model", "optimizer", "lr"]
+        assert split_id(0) == ["0"]
+
+    def test_split_id_returns_private_lists(self):
+        """Test callers may mutate the result without affecting later splits."""
+        parts = split_id("data::0::value")
+        parts.append("extra")
+        assert split_id("data::0::value") == ["data", "0", "value"]
+
+    def test_repeated_split_parts_is_cached(self):
+        """Test the same path is split once and the tuple is reused."""
+        assert split_id_parts("data::0::value") == ("data", "0", "value")
+        assert split_id_parts("data::0::value") is split_id_parts("data::0::value")
@@ -9,21 +9,31 @@ from sparkwheel.preprocessor import Preprocessor
 class TestPreprocessor:
     """Test Preprocessor functionality."""
 
-    def test_circular_raw_reference(self, tmp_path):
+    def test_circular_raw_reference(self, yaml_file_factory):
         """Test detection of circular raw references."""
-        config_file = tmp_path / "config.yaml"
-        # Use quotes to prevent YAML from interpreting % as alias
-        config_file.write_text('a: "%b"\nb: "%a"')
+        config_file = yaml_file_factory({"a": "%b", "b": "%a"})
 
         loader = Loader()
         preprocessor = Preprocessor(loader)
 
         # Load the config and try to process it
-        config, _ = loader.load_file(str(config_file))
+        config, _ = loader.load_file(config_file)
 
         with pytest.raises(ValueError, match="Circular raw reference detected"):
             preprocessor.process(config, config)
 
+    @pytest.mark.filesystem
+    def test_external_raw_reference_is_not_copied(self, yaml_file_factory, monkeypatch):
+        """Test values from a file loaded for a raw reference are used without a deep copy."""
+        config_file = yaml_file_factory({"model": {"layers": [1, 2]}})
+        monkeypatch.setattr("sparkwheel.preprocessor.copy_config", pytest.fail)
+
+        config = {"a": f"%{config_file}::model", "b": f"%{config_file}::model"}
+        result = Preprocessor(Loader()).process(config, config)
+
+        assert result["a"] == result["b"] == {"layers": [1, 2]}
+        assert result["a"] is not result["b"]  # Each reference loads its own copy of the file
+
     def test_get_by_id_empty_id(self):
         """Test _get_by_id with empty ID returns whole config."""
         config = {"key": "value", "nested": {"item": 123}}
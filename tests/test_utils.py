@@ -18,6 +18,7 @@ import pytest
 from sparkwheel.utils import (
     CheckKeyDuplicatesYamlLoader,
     check_key_duplicates,
+    copy_config,
     damerau_levenshtein_distance,
     ensure_tuple,
     first,
@@ -113,6 +114,40 @@ class TestMiscUtils:
         assert isinstance(result, tuple)
         assert len(result) == 3
 
+    @pytest.mark.parametrize(
+        "extra",
+        [pytest.param(None, id="plain"), pytest.param(Counter(a=1), id="with_custom_object")],
+    )
+    def test_copy_config_plain_data(self, extra):
+        """Test copy_config copies every container, splitting repeated references to one container."""
+        shared = [1, 2]
+        data = {"a": [1, {"b": "leaf"}], "c": None, "x": shared, "y": shared, "extra": extra}
+        result = copy_config(data)
+        assert result == data
+        assert result is not data and result["a"] is not data["a"] and result["a"][1] is not data["a"][1]
+        assert result["x"] is not shared and result["x"] is not result["y"]
+
+    def test_copy_config_shares_leaves_of_mixed_trees(self):
+        """Test trees that are not entirely plain data keep sharing their immutable leaves."""
+        leaf = "shared string"
+        data = {"a": [1, {"b": leaf}], "obj": Counter()}
+        assert copy_config(data)["a"][1]["b"] is leaf
+
+    def test_copy_config_falls_back_to_deepcopy(self):
+        """Test copy_config deep copies types it does not special-case."""
+        data = {"counts": Counter(a=1), "pair": ([1], 2)}
+        result = copy_config(data)
+        assert result == data
+        assert result["counts"] is not data["counts"]
+        assert result["pair"][0] is not data["pair"][0]
+
+    def test_copy_config_cyclic_data(self):
+        """Test cyclic plain data is copied with its cycle intact instead of recursing forever."""
+        loop = [1]
+        loop.append(loop)
+        result = copy_config({"b": loop})
+        assert result["b"] is not loop and result["b"][1] is result["b"]
+
     def test_check_key_duplicates_no_duplicates(self):
         """Test check_key_duplicates with unique keys."""
         pairs = [("a", 1), ("b", 2), ("c", 3)]
@@ -337,6 +372,33 @@ class TestModuleUtils:
         with pytest.raises(ModuleNotFoundError, match="Cannot locate"):
             instantiate("nonexistent.module.Class", "default")
 
+    def test_instantiate_caches_located_target(self, monkeypatch):
+        """Test a dotted path is located once and reused across instantiations."""
+        from sparkwheel.utils import module
+
+        calls = []
+        original = module.locate
+
+        def counting_locate(path):
+            calls.append(path)
+            return original(path)
+
+        module._locate_found.cache_clear()
+        monkeypatch.setattr(module, "locate", counting_locate)
+
+        assert instantiate("collections.Counter", "default", a=1) == Counter(a=1)
+        assert instantiate("collections.Counter", "default", b=2) == Counter(b=2)
+        assert calls == ["collections.Counter"]
+
+    def test_locate_cache_is_bounded_and_skips_misses(self):
+        """Test located targets live in a bounded cache and failed lookups are retried."""
+        from sparkwheel.utils import module
+
+        module._locate_found.cache_clear()
+        assert module._locate("no.such.module.Thing") is None
+        assert module._locate_found.cache_info().currsize == 0
+        assert module._locate_found.cache_info().maxsize is not None
+
     def test_instantiate_not_callable_warning(self):
         """Test instantiate warns for non-callable."""
         with warnings.catch_warnings(record=True) as w: